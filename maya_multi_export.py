@@ -6,16 +6,24 @@ Drag and drop this file into Maya's viewport to install.
 Compatible with Maya 2025+.
 """
 
+import glob
+import hashlib
+import importlib
 import math
 import os
 import re
 import subprocess
 import sys
 import shutil
+import time
 import base64
 import traceback
-from functools import partial
+from collections import Counter, deque, namedtuple
+from functools import lru_cache, partial
+from itertools import chain
+from pathlib import Path
 
+import maya.api.OpenMaya as om
 import maya.cmds as cmds
 import maya.mel as mel
 
@@ -24,6 +32,8 @@ import maya.mel as mel
 # ---------------------------------------------------------------------------
 TOOL_NAME = "maya_multi_export"
 TOOL_VERSION = "v7_beta_4"
+# Prefix for every Export Genie dialog message
+_EXPORT_HEADER = "Export Genie {}\n\n".format(TOOL_VERSION)
 WINDOW_NAME = "multiExportWindow"
 SHELF_BUTTON_LABEL = "Export_Genie"
 ICON_FILENAME = "maya_multi_export.png"
@@ -33,16 +43,60 @@ TAB_CAMERA_TRACK = "camera_track"
 TAB_MATCHMOVE = "matchmove"
 TAB_FACE_TRACK = "face_track"
 
+# Geo children skipped for OBJ export (chisels groups and the nulls group,
+# which export_jsx turns into null layers instead)
+_GEO_SKIP_RE = re.compile(r"chisels|nulls", re.IGNORECASE)
+
+# Intermediate frame format for the .mp4 QC.  Uncompressed BMP skips the
+# PNG deflate on write and the inflate when ffmpeg reads the frames back.
+_MP4_FRAME_FORMAT = "bmp"
+
 
 # Base64-encoded 32x32 RGBA PNG icon (purple-to-cyan gradient with export arrow and badge)
 ICON_DATA = (
     "iVBORw0KGgoAAAANSUhEUgAAADIAAAAyCAYAAAAeP4ixAAAACXBIWXMAAAsTAAALEwEAmpwYAAADKUlEQVR4nO2aWUhVURSGP83MyqB5sKigp4oGfSjSigIhyQoi04Kwt16iiYik6CEoeimIaCBooJkgqKC3CsGQBJ8aCRQbLMrANMNG8saG/8LhcK+ec+65527DDxZc9rDO/s+w91qLCwP8/8wBDgG1QBvwU9amtsPAXCxmInAb6AFiHuwuUIBlTAbeeRTgtPfANCziei+L/StL1n8Li+hIskjzTRTKapOM+YpFtLoW1wSsVd9QGWprco19jUVUamcyT2Y3kAtkqf2NrFJtuRrToTkVWEYBMFa/i4C6BK9RnfrQWOt2LTe9fdymr98Q68P6DbH/RUh3LyJMn1XkAAuBHcAFoNzRNwE46hLUrTbTF6dcc7cDC+QzEgYBa4DLQHuCu90AlLkEHZM5BZRprHt+O3AJWK1rhc5woMZHPFUPlCbwU6o+Lz7eAnuBYWGJ2KDgzm9AGD83lskSnSterBWoSkXAYOBswIunw85oTb4wocRFCxYfc9lVrc0zVT6ch4EfMRV+HD+2WEi9H8ffQn4lPgPVjtdiHLAPaAQ6ffrq8iOkOSQBPTrwxshvjg6/ZIlYzIM99SNkk48iQjIzGeESh0+zBT9P0WcnUIJPVgV4Mr9UHVmcwN984AbwO4CAbuAkMJWAmDBhOXBEC2yWU5NTfFHm9wA4od1klGPuaOAgcBqY4mgfqV3xFPAQaJEvI9BkjJ+02VwBDgArgDwixnzMxbp7XY47+kOCSvyeA+lmiApys4ClwE7gmp5QX6+JidfOK2o2T3uGdjHjM3I+hLw9O21LlELupElEA5AdpZD9aRBhvqOZRExxGoSYCn7kZCnxCUuEyXfyyRDHQxSylQyyKCQR5rwZQYZpDEGIOSgzzroQhKzEArKARykKmYQlFAaMaOMJV2RFOS/UBBDxCpiNZWQD9zwKeAHscoTmkYYkXquRja6Q4yPwTJHxHiVXcXIkqF5z+x3jgW3AS1cevhmYrsTLKvKUs5hAcL3+8XAf+JNCDWBeJrbljSnUjGMOa9F5lVHyVf7xWz3pUd5eHaTem26KlN7eBJ6oyv5d1qqN4pwyRKv+1jEAAfgH91gQ3NV/zakAAAAASUVORK5CYII=+48GgAAIABJREFUeJzt3Xm4HWWV7/HfqtpJSLJPJkYj5wRIECRh8EZEBg2TLXCvtHgJl6HjTRSEVlFxpEHpdLdto17EqftRvN3XgTmI4oA0KgmCoRXDmIhgUGYEzHimkJyqdf84IcSQYe9zqvZbtev7eZ76B5Kzf8neqbVqvW/VlgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAxWKhAwB5WDFt0rg4SnYx1XbxWOMkN6WaEDoXMGyRrUrT9PlRUfzCmN3//IIt0kDoSCgnGgCU1p8O2n3s6A0bDnTXgSY/UKZpck2RtJekMYHjAa3ymLvuM7P7zdL7bP3A4o5He54PHQrFRwOA0li7f8fOqY043uRvknSEpAMl1QLHAoomlfsSRdHNMrt53LIVd5vkoUOheGgAUGjdB0yanqbpqTKdJNnrJUWhMwEl86hL36jFI75ZX/r8c6HDoDhoAFA4K2ZM6qwl6VzJTpd0QOg8QJtYb9JNSeSfmbhs9X2hwyA8GgAUgktR92snnOxm50r6K3GlD+TFTbrBoujvO5aueCh0GIRDA4Cg/nTQ7mNHDwy8W9IHJJ8aOg9QGabEpW8qSj424cE1q0LHQevRACCIZ2ZOHjO2b905Mn1C0qtC5wEq7Dm5fXz8Qyu+HToIWosGAC3lsxWvWTbxbDP7B0m7h84DYJBJN7oGzhm/bO3K0FnQGjQAaJnVr935eMV+ublmhM4CYKv+kJifMmnpqgdCB0H+aACQu9UHjp8YpfGlLp0jPnNA0a0z2Xnjlq34VuggyBcnY+RqzfSJZ8jsK5J2Dp0FQONcdtGEpSv+JXQO5IcGALlYOXPi+PhFfUWyOaGzABgac/vsuGUrLgydA/mgAUDm1hyw82GK/HpJXaGzABgec7t03LIVfxc6B7JHA4BMrTlo53e6+9dMGh06C4BsuPzvJjy46tLQOZAtGgBkwo9WrXvFpH9z2TmhswDIXJq6Zk9cuuLG0EGQHRoADNvz03etj4qS6yQ7KXQWAPlwqd8iHT3+/hW/Dp0F2aABwLD0zNht9zRKb3X5QaGzAMjdk2mUHDTxvtWrQwfB8PGFKxiy3pm7vCqJkp9T/IHK6Iw8/mroEMgGEwAMycqZE7viDfEiyfcOnQVAa7n7aRMeXLkgdA4MDw0AmrZy5sSueCD+quRvC50FQACuFTZi/f7jlnT/OXQUDB1LAGjKypkTu2oD0TclPyF0FgCBmHb2gZF/HzoGhocJABo2eOVvC11Rt8kPDp0HQFADUeQHd9y78rehg2BoaqEDoBxWzpzYFSe2UBY9a/IjQ+cBEFwtdfuMpLeHDoKhYQKAHdpU/N12NVOfS7uHzgSgGNzs0An3/vk3oXOgeUwAsF2DxT9eKGkfM93u0qzQmQAUh7m/T9K80DnQPCYA2KZNxd+0j8uWm3yKpBGhcwEolBfjmu1Vv/uFP4UOguZwFwC2avPiL8kjpf2i+AN4pVHJgL8ndAg0jwYAr7BF8Zdki112YNhUAArsrNAB0DyWAPAXVs6c2BX74Jr/xv/UbaY+dzb+Adi2KEoO7PjNqqWhc6BxTACwyVaKv0y6h+IPYEfSND41dAY0hwYAkrZe/F223CXu+QewQ8bzAEqHJQAMFn/9ZfGX5C49YBJP/APQCPf1G3ae8OCaVaGDoDFMACpuG8Vfki2m+ANogmlkfGjoEGgcDUCFbbv4q9vk00JkAlBeZtERoTOgcTwJsKJWzpzYFVtta8V/cOMfT/wD0DwmACVCA1BB2yv+Li2XRBcPYCimhg6AxtEAVMzKmRO74mjrxV+SS+oVT/wDMDRTXDIbPJeg4NgDUCE7KP6Si41/AIZjp95Dd+W5ISVBA1AROyz+g0/827eVmQC0n0RpZ+gMaAxLABWwcubErjjebvFn4x+ATERuY0JnQGOYALS5Roq/m5Y7G/8AZCCJolGhM6AxNABtrJHiL8nlbPwDkI3I05GhM6AxLAG0qZUzJ3bFtR0Wf0n6pUlHtSJTZbh9weX/FToG2ofJ3ijzD4fO0YhUTADKggagDa2cObkrrg00Uvy7TdqX+3Wy5fL/mvDrFxaEzoH2sfoNu8rK8tUt7kyWS4I3qs00Ufxl5ve4+KpfAKgiJgBtZOVRk7viZGChfMfFf/CJf3ZEWS4qSoW2GlmLVZ5H6/D5Lw3eqjbRTPEXT/wDgMqjAWgDTRZ/STzxDwCqjiWAkttU/KV9Ghznd5s0rSzTRAAbsVyHjDEBKLGNxX+RGtjw9xITG/8AAEwASmuz4r93o79n08Y/AEDl0QCU0Kbib40Xf0keufrcSrnxLzGzG919duggDWF9BXkoyxIAn//SYAmgZIZY/CXTYjcdlFOsPCWS5qZpyoN1ACBDTABKZOVRk7tqSbJIZs0Vf6nbvJQb/xKXzx2/+Pkruw/fY7aX5NIioq9GxmLF4vOPrNEAlMTKoyZ31TxZpKjJK39Jct3jVrqv+k3cB4u/JB6Egmrj848c8FaVwKbi38SGv5e4tFxWuq/6/cviDwDIHA1AwQ2n+EtyK98T/yj+ANACLAEU2MqjJnfVlDS/4e9liyUdmWWmnCVuPnf8Hdso/mXZBQ3kgc8/MsYEoKA2Ff+hXflLG5/4l2GkvG2/+AMAMkUDUEAZFH9JKtMT/yj+ANBiLAEUzMqjJnfVbHjF36XlptJs/Bu81a+R4l+WEWhZdmujXPj8I2NMAAoki+Kvcm38a7z4AwAyRQNQEBkVf2lw418ZvuqX4g8AAbEEUAArj5rcVYvSRVLTT/jbUreZpnnxR3CJu80df8ezjRf/WIOzjTKgrUbW+PwjB7xVgb1c/Id95S9J97gXfuNf88UfAJA5GoCAsiz+g1/1W/iNfxR/ACgIlgACWXnU5K5anNmVv5usV/Iib/xL3Gzu+EXDKP4lmYACueDzj4wxAQgg4+IvuS+WvMgb/4Zf/AEAmaIBaLHMi7/UbWZFfuIfxR8ACoglgBZaefzkrtpApsVfGnziX1G/6jdxZVj8yzICLf5dGCgjPv/IGBOAFsmj+Bd841+2xR8AkCkagBbI6cp/48a/Qj7xj+IPAAXHEkDOVh4/uauW+CLZsB/ys6WNX/VbuLlg4q7si3+pHoTCDBQZ4/OPHDAByNGm4p/tlb/khf2q33yKPwAgczQAOcmt+EuSFfKrfin+AFAiLAHk4OWxf/bF32Ubv+q3UGO2xE1zx/885+JfkgkokAs+/8gYDUDG8iz+ktzkRdv415riDwDIFEsAGcq5+EvF+6pfij8AlBQTgIysOnbvKbGvu12RpuT0Emsl7ZvTzx6KxN3mjP/5M9e07BXLMgIt1OoM2gaff2SMCUAG+o7d89WxrbtNrsdyexHXvZJ2y+3nNydxae7421pY/AEAmaIBGKbuE/fYdcCSWyXtI9MsuW7P+jXcbbnMivLEv8Hiz9gfAEqNJYBheOZtk8d4v98s0wGb/qNplsl+5vLjM3oZjyztc1kRNv4lbjZn/E8DXPnHKs9okbYaWePzjxzQAAyRz1fUfYeulNnrX/H/pOMl3S5ZFl/Ss9hlR2bwc4YrcfO5QYq/JM6AqDY+/8ge79QQdd85+bMynbLtX2GzTPrZsF7E1W1mRdj4l7hpzvifMvYHgHbBBGAI1v7V5LfL9ZEd/brBSYAPfRJgPvhVv2F3/yYunzv+p8+G3/BXll3QQB74/CNjTACa1H3cHgfI9R01/M/RZpkNZRJgyxV+9J+4uPIHgHbEBKAJfuK0Ud1J3zWS6k39Pul4WVOTANfgE/9Cvj+Je0Gu/F9SliugsizVolz4/CNjTACa0J32fkbSQUP73TZrcDmgIaGf+PdS8efKHwDaFA1Ag7rfsscsuX1oeD+loeWAblPQjX+JO2N/AGh3LAE0wE+cNqo77fuaMmiYNm0MtG0sB5jf464sbh8cisFb/W4p0Nj/JdwFhSrj848c8FY1oDvtv0TS/pn9QLNZ8lcuB7hsuTwK9cS/l4o/V/4AUAE0ADuw9qRXv0byj2X+g+0VzwnwyLxP8hBP/Bu8z5/iDwCVwRLAjqT6P7J8HsP78hMDNUvSYpeODLDTN3HZ3PG3PFW8sf+WrCzboIEc8PlHxpgAbEf3W199jKS35fwyszTYBITY+Je4fM74W57iyh8AKoYJwHa46TMteqkQm/42Xvk/XfwrfwBA5mgAtmHNiXueKPkbQ+fISeJuc0t35V+WCWhZdmujXPj8I2M0ANtg8r8PnSEnibvP4cofAKqNPQBb0X1S55slHRY6Rw42XvmH+kpfAEBRMAHYCpdfUJpxW+MSN5s7/sclG/u/hAehoMr4/CMHNABbWHXCHntJnvfO/1Yb3O3/Y8b+AIBB9GpbiOL4XRrst9vF4JX/zYz9AQAvYwKwGZ+vqOdu+9/ePuP/xKXyjv23VJoHoZRlVotS4fOPjNEAbGbNks7jI3lX6BwZSdxtzvibn+TKHwDwCiwBbCZK/bTQGTIyeOVP8QcAbAMTgI38aNW6TSeHzpGBxL2Nxv6bYwKKKuPzj4zRAGzUW3/1LEm7hs4xTImbzRn/I678AQDbRwOwUep2Qmk67G171qRT1r6t85TQQbLm7nuGztA4S0InAIAdoQF4SaS3ho6QgT0lnx06RC5K1JwlUdQdOgPaDA8CQg54qyT1nLTXHpJmhM6B9hClSU/oDACwIzQAkrw2cIRKdY2JIjNnAgCg+FgCkOSmw0NnQPuIa8ma0BnQhrhEQcZoACTJrR2/+Q9hrBv9umee1k2hY6C9sAkA2av8O+WDffWBoXOgTZiW23yloWMAwI5UfgKw6m2TO2umCaFzoE2YHgkdAW2qLEsAZRlUgAlAHEfTQ2dAW3k4dAAAaETlGwClmho6AtqI2eLQEQCgEZVfArDYpjCyQkaSxKM7Q4dAG2IPIHJQ+bfKXe3y9b8I796J339sdegQANCIyjcAJu0WOgPahNvC0BEAoFGVXwKQlf4bAFEQHvmC0BnQxspyFwBKo/ITAEmTQgdAW3hk/I1P3h06BAA0igmAbGzoBCg/k64KnQHtjhEAskUDYBoROgJKL01SpwFAvspS/8tytwJYApA0KnQAlJ3fNOH7Tz4aOgUANIMGgL8DDJdHnw8dAQCaxRJAWcZqKCSXfjb+xsfvCp0DbY4HASEHvFXAMETu/xQ6AwAMBQ0AMETudm3HjU/+InQOVEBamuv/cmWtOJYAWALA0HSPiJKPhg6Bakhj6zcvR11NzXpDZ0BjmAAAQ2H2T2MWPPV06BiohihJu0NnaJSZlyZr1dEAAM37dcfEXb4YOgSqY2Bk/EToDI2qxQOPh86AxrAEYKwBoCkrBxTPtiuWbAgdBNUxYf/HnuheNqVf0ujQWbbHpL7R1z7zVOgcaAwTAKBxLunsSQv+UJqrMbQHm69U0pLQOXbEpbutPDcsVh4NANAos8+PW/D490LHQDW5q/BfN23uhc+Il7EEwAoAGmDSNfUDHvu70DlQXW5+k5l9KnSO7bEo/n7oDGgcEwBgB9z183r3iHkbx7BAEBMWPLFE0tLQObbJtax+3R/vDx0DjWMCwAQA2/fLF73v7faTF14MHQQws6+6/Guhc2ydfyl0AjSHCQCwLW4/6EiTt+y24IWe0FEASaqvrX1TUuGeP2HSEx3e8a3QOdAcGgBga8y/1fH8Y//TFjzVHzoK8BL7yfIX3f3C0DlewezjtmDZ+tAx0JzKD8DXnj6FW1awuQGZXdJxzWOXcjsTisglW3v6lJ+adFzoLJJk8ls7rn3iraFzoHnsAaAHwib+lBSdOe6aP94ROgmwLSZ5j0Vnpe73SdojcJznI6XzAmfAELEEAEiS64caOXDIuGsp/ii++jV/fM5Mp0taFzDGOslOHXvtk88EzIBhqPzl79oz9mLMW2FmekKpfaTj2j/eEDoL0KzuM6e8w13XSdbiaa4PyHXauGt5MFaZMQFAVW0w05fX7TRqBsUfZdVx9eM3KopPMVNfq17TTH3uejvFv/yYADABqJpek/5v7PFlY6599MnQYYAsrD6za2bk0fWS9sn1hdyXp67/NeG6x+/J9XXQEjQAZ9IAVMRzLr/CfNSXx13zyJ9DhwGytnL2PuNrtfQLMs1T9uf2VPL/2GAjPrLzVcvXZvyzEQgNAA1AO+uV+fdcunrc03v/1BYtGggdCMjb2jOmHC6zf5Z0TBY/z2U/V+oXj7/2sV9l8fNQHDQANADtJDHZfe5apMgW9UW9C/f4znO9oUMBIaw5a683WqpzZDpV0rhmf7tkN3jq36Dwty8agLNoAEqkV1KPpF6TrXLzZyR/2NLo94r8kYGa7pv4zcdWhw4JFInP3WunnvV+eCodY2YzJO2nwecH1Df+kh5Jz0p6xKUHI9PC+oraXfaT5Xz/RZujAShLA2BaMO7Kx04LHQMA0B54EiA9EACggmgAqP8AgAriQUAAAFQQDQAAABXEEgBLAACACmICAABABdEAAABQQSwBlGUJoCw5AQClwAQAAIAKogEAAKCCKr8EYFaW2XpZcgIAyoAJAAAAFUQDAABABVV+CYDJOgCgipgAAABQQTQAAABUEEsAZVkCKEtOAEApMAEAAKCCaAAAAKgglgBK8yAgAACywwQAAIAKogEAAKCCWAJgBQAAUEFMAAAAqCAaAAAAKoglgLIsAZQlJ4Bh8/Onjep+MT3U0uhgSdMkf5XJx7gslavf5c9YpN+nHt03bs89f2PzFw2EzozyoQEAgALwC/Yc3dsz8h2SndHT78eabLTkL///l64CTDKZ5FIkV+9TT/R2nz31Vsmurq8Z9QNbsGx9oD8CSoYGAAACWnHWtHEjR6cX9HTb+yTt2uzvd9lYSadIfkrP+HXPrD176hc7ov5/tSue6cs+LdoJewCsJAeAttNzzrQ5I0f7wzKbL9OuGZwrJpvpc90++rdrz5l6Suv/RCgTJgBUVwAttuL8aeNGrrOvu/z0PJ5GatIUSTeuPWfad9aNGPXe3f5tWU/mL4LSYwIAAC20+uz99h65Tr+R/PS8X8ukOaM3vHhn73te+6q8XwvlQwMQerTPMgBQGd1n7/vaOBr4pUz7tvDccbBrwy9Xv2fa1Fb9OVEONAAA0AJ9573m1R75TyRr+dW4S3vH0qI17546rdWvjeKiAQCAnPncvXZK0vRHG9fmQ9kziu02JgF4CQ1A6LF+owfvFFBaPSNrn5fpkODnEVNnbFpIEwCJsgIAuVp7ztQjZHpf6Byb6YxNi9a8l+WAqqMBAICc+HxFFtlXVbxtvHtGCcsBVUcDEH4k19gBoHS6n532NpleF/z8sa3lgIjlgCqjAQCAnJjpw6Ez7ABNQIXRAJiV5OCtAsqk/317T5HZm8KfO3Z4dMax0QRUEFUFAHKwIYnPUHkW8AabgL99zT6hg6B1aAAAIAcW2bGhMzSpM5YvYhJQHTQA4TfiNHbwTgGl4fMVSTo8+Hmj+aMzrjEJqArKCgBkbN0Le3dKqofOMUSdsfmi1eczCWh3NAAAkLEBj8p+Bd0Zp3Ybk4D2RgMQfuTW2AGgNNziCcHPGcM/53TFEZOAdkYDAAAZizwdEzpDRpgEtDEaAADImEsvhs6QISYBbYoGIPxDOBo8Qv9FAWiUxVob/pyR6dEZe8wkoM3QAABAxtIofjx0hux5VxyLSUAboQEAgIx19Nf/IGlD6Bw5YBLQRmgAQu+0bfTgnQJKw65YskGmJcHPG7kc3hXXmAS0A8oKAOTATItCZ8hRZ6z4ttUXMAkoMxoAAMiBpfbd0Bny5V3xAJOAMqMBCD5Oa/AAUCpjv/rwb2R6OPi5I9+jMzYmAWVFAwAAufEvhk6QPyYBZUUDAAA5qcf935L0TOgcuWMSUEo0AOFHaCwDAG3KLn+q38w+Efzc0ZLDu+KUSUCZ0ACE/1fTxAGgbMZ+6eGr5NHPwp8/WnJ0xlF82+r377d3Zn+ByA0NAADkyCQ3q/2NpD+FztIiXXGs25kEFB8NQPCGucGDdwoorfqXlj7n8tky9Qc/l7Tm6IxjJgFFR1kBgBYY96VH7nTTGZIGQmdpkcEnBtIEFBYNAAC0yLjLH75JbqerPb8nYGu64hrLAUVFAxB+VNbYAaAtdHzpd99VZGfItCH4eaVVywG1eOHqj9EEFA0NAAC0WMcXfvddmZ2h6kwCOuMBmoCioQEAgABoAhAaDUD48RjLAEBFbWoCqrQckNAEFAUNAAAE1PGF331XqtgkgCagEGgACtASN3bwVgHtanASoDMl2xD+XNOSgyagAKgqwf8dNHjwTgFtreOyh2+Q+ZmqzHKAdcYpTUBIlBUAKIiOyx6+QfIzVZnlAJqAkGgAAKBAaALQKjQAwcdgDR4AKmNTE1Cl5QCnCWg1GgAAKKCOyx6+QV6xSQBNQEvRAABAQdEEIE80AMFHX00cACqn47KHb1BUseUAxQtXX/iafTL7S8RW0QAAQMF1fG7jLYJVmgQkEU1AzmgAAKAEqtcEqIsmIF80AGblOHingMobbALiM2U2EPyc1JqjK05ZDsgLZQUASqTjc8tukKIzJA2EztIiNAE5oQEAgJKhCUAWaACC7HIdwgEAm9nUBJgGgp+fWnN0xU4TkCUaAAAoqY7PLbtBXrFJAE1AZmgAAKDEaAIwVLXQAYJjvI5h6P34fpOTOHqDpNeYa4pLY00aEzoXqiaVpGcldQYO0ipdNcU/X3Xh/sdMvPR3j4UOU1Y0AECTui967QxLNMdNf51K+5m//P/oJ4HWcGmvEbKFNAFDRwMANKjnogOO80QXK/VjnEoPBEcTMDw0AFaSM3lJYrajvo8ftGcSD1zurlMHd83wZgBF4dJeNdntqy888JgJlz74h9B5yoRNgMB29Fx0wN8k8cBDkk4NnQXANnXFlixcfeGBbAxsAhMALuawFT5fUc/66V9w+Qf5jACl0FWzhI2BTWACAGzBZyvuefGAb0v+wdBZADTOpb1GRNHC/k9M7wqdpQxoAIAt9Ox7wOUynRU6B4DmubTXQOw/655/0G6hsxQdSwCMd7GZnk9Ov8Ddzw+dA8Cw7KsNG67z2TreFigJHaaomAAAG/V+avqh7n5p6BwAsmBH9+x7wCdDpygyGgBAg+v+aepXSBoZOguAjJg+2fOp/Q8MHaOoWAIoyxJAWXKWVM/+0/9W7oeEzgEgUzVPo8slHR86SBExAUDl+XtmjpD7x0LnAJAD03FrL55+VOgYRcQEoDSX1mXJWT69u647UzJuGwLalJk+JunO0DmKhgaAulp5Hmlu6AwAcnVSz0Uzdq9/ZulzoYMUCUsAqLSe+dP3kPTm0DkA5KrmsU4JHaJoaABQbYmOFf8OgArw40InKBqWAFgCqDSPdKQ8dAoALcBGwC1w5YNqS3VA6AgAWmKPNfOnTwodokhoAFBtJr4+FKiIWqKpoTMUCUsAZVkCKEvOsjFNCB0BQGu4jH/vm2ECgGozjQ0dAUBrpFI9dIYioQFAtbleDB0BQGvESteFzlAkLAEYs/VKM+uWNCZ0DAD5S0zdoTMUCRMAVJpLT4bOAKA1ajV7PHSGIqEBQKWZ9HDoDABaom/0wNKnQ4coEpYAWAGoNDPd7dJZoXMAyJnp13aJ0tAxioQJAKrN7LbQEQC0gGtR6AhFQwOASqtf8uCDkj8SOgeAnHn03dARioYlgLIsAZQlZxlFdrVc80PHAJAT09KOTz2wNHSMomECgMqzxL8uqT90DgD5cNfloTMUEQ0AKq8+f9mf5Ppm6BwAcvFER+pXhg5RRJVfArCSPAioHCnLy2r6B6V2uqSJobMAyI67f8zmL1sfOkcRMQEAJNUvXvqcuV8UOgeATN3accnS60OHKCoaAGCjsZcs/ZrJbgydA0AmnrdoYG7oEEVW+SUAZuvY3PokeveIWvIaSTNCZwEwZOvSyE4dd9FDz4YOUmRMAIDNTJx/3+pI0QmS/hg6C4AhSdz9rHEXPXBH6CBFRwMAbGHMJ+9/2mzgSMnuC50FQFMSmc/t+NRSlvIaQANgJTl4p1pq7MUPPbu+NuJoM/9u8Peeg4OjkSORbE794qXc8tcgygqwDZMuXLJm7MVLTzXpXEmrQucBsE2J3ObUP/nANaGDlAkNALADYy9+8ArfYPub9K+S1oXOA+AvUPyHiLsALHQAlEHH/Aeel/T+3n9+7T/LaudImuPStNC5gIpLZDan/ncU/6GgAShNB1CWnO1t7MUPPSvpHyX9Y/elB09XomPN/FBJ+0nqMqnuUj1sSqASErm/s34RxX+oaACAIeq48P5lkpaFzgH0Xzq9ayCNF5q0T+gsLZLIbW794geuDh2kzGgAuLAGUGL9l07vGvB4oVmFir/Z3PqF97Pbf5jYBAgAJbWp+Ffpyp/inxkaAAAoIYo/hoslgLIsAZQlJ4Dc9V86vWtAFRv7i+KfNRoAACiRvk/P6BxQVK0rf4p/LlgCAICS6Pv0jE6vUfyRDSYAjNYBlEDfZTM6fSBa6NLU0FlaZPBWP4p/bpgAAEDBUfyRByYAjAAAFNhg8a8tdHl1ir80j+KfPxoA6j+Aguq7bEanJ7WFbhUq/q559U/c/53QQaqAJQAAKKBNxb9KV/4U/5aiAQCAgqH4oxVYAijLEkBZcgIYlr7LZnR6WrGxv2le/aMU/1ZjAgAABbGp+Ffpyp/iHwwTAK6sARRA32UzOt0rduUvin9ITAAAILBNxb9KV/4U/+BoAAAgIIo/QmEJwFgDABBG32UzOl21hW6aWpH1yERu8+ofvZfiXwBMAAAggE3Fv1qP96X4FwgNAAC0GMUfRcASQFmmbmXJCWC7+i6b0elRbaF7hYq/2bz6BRT/oqEBAIAW6fvyQXt4TQshAAAMnklEQVQmA9Eic+0TOkuLJHKfW//wfXyxTwHRAABAC6y6/JAJ6YB+bKpQ8TebR/EvLhoARusAcubXz457n/7992U6KHSWFklkPrf+IYp/kbEJEABy1vPUI5dImhU6R4skks2rf+h+in/B0QAAQI66v3DwdDO7KHSOFhks/mz4KwWWAFgCAJAji+zfVI1zbSIx9i+TKnwod6AsHUBZcgJ4Sc/lrzte0ptD52iBwW/1+yDFv0xYAgCAvJg+EjpCCySSza1/kLF/2TABKMuFdVlyApAk9X7ldZM91VtC58hZIte76h+6hyv/EmICAAA58NRnS4pD58hRIre59Q/d++3QQTA0NAAAkI/jQwfIEVf+bYAGwEpyACgNd5nMjgp+3sjnSBRx5d8OaAAAIGP9lx88WdKE0DlykEh6V/18rvzbAQ0AAGQsiaJ2/Ka/RK559Q9w5d8uuAuA8TqAjEWxT/L2OrkMrvlzq19boQEAgIy5NCZ0hgwNPuTnfIp/u6EBaK8uHUABuOINJg8dIwuJ3N9F8W9PNABlqf9lyQlAFnl3G9T/RHKu/NsYmwABIGPuyZOhMwxTIvN31d9P8W9nNAAAkLH62ImPavCWuTIavPJ/H7v92x0NQPiHavAgIKDN2LxF62R6IPh5YygP+eHKvzJoAAAgD6bbQ0doUiLnyr9KaAAAIAee+vdCZ2hCInHlXzU0AOFHbiwDAG2o/ud775TpieDnjUbG/hFX/lVEAwAAObD5SuX2ldA5dmDwPv+/5cq/imgAACAnLya1KyRfGTrHNgwWf678K4sGwKwcR8QaAFA2O3/gV2tddknw88crj1Syd1P8q40GAAByVN9l6tckvzt0js0kMptXf++Sb4UOgrBoAAAgR3bagmQgsjMkrQmdRVIq17vr5/2GK3/QABRgB25jB4DSmnDukkfNfI5MA0F3+3Plj83QAABAC4w9754fmuw8KcjXBCWSvYsrf2yOBgAAWmTseb/5d8nfKWlDC1/2RTedQfHHlmgAQo/2WQYAKqV+3j1XeuwnyPSnFpw3Ho9MszrOXbKgdX9ClAUNAAC0WMc599ymqHaIS9/P6SVcrqsGkvWvG3Pukl/l9BoouVroAABQRfVzfvWcpFN6vvbfTpDZv0g6JIuf67K7PEo/Me6ce+7I4uehfdEAWElm62XJCaAp9fPuuUXSLT1X/Le3uuxck50oaacmf0yvpB94al/rOO/uX2SfEu2IBgAACqD+nnv+U9J/rvz6zPGjIjvaUx0ts4MknyZpD0kjN/7SFyV/VrLfy3WfyW8fM3rDInvnA73h0qOMaAAAoEAmnbtkjaSbNh6b+NdnjtCzHW7zFw2ESYZ2QwPAZB1ACdi5S1p56yAqgLsAAACoIBoAAAAqiCUAlgAAABXEBAAAgApiAlCWCUBZcgIASoEJAAAAFcQEgEtrAEAF0QBQ/wEAFcQSAAAAFUQDAABABbEEwBIAAKCCmAAAAFBBNAAAAFQQSwBlWQIoS04AQCkwAQAAoIJoAAAAqCCWAIzZOgCgepgAAABQQTQAAABUEEsArAAAACqICQAAABVEAwAAQAWxBFCWJYCy5AQAlAITAAAAKogJAAC0OZ+vqHfqGw6U+YGuaD95upu51SXJzXuk6DlT+rDS6MGxf/zVUpuvNHRm5I8GoDQPAipLTgBF4AuPrvU91fdWl/1Nr+ktknaWbPBMYtGmU4ptOrdEUiz1Tjvszz1X2q1mftWYyaNvtWMWDYT5EyBvNAAA0Eb8+sNH96z3s3ufXvdRmXUN4UfsIvmZ7jqz9+n+x7uvPOzz9Q2j/93mLVqXeVgExR4AAGgTPVceelzv+vRek39Z8qEU/y1NMemrPSP6l/VeddhJGfw8FAgTACbrAErO/9/RO/WO7P+spA/k8fNN2selH/dcddh3xvYMnGfnLunL43XQWkwAAKDEeq4/dI/ekX2LlVPx38Kc3nrtFz1XH7Z7C14LOaMBAICS6r/qiCm2we6U7HUtfNmZ5v7L/m/PzGKJAQHRAFhJDt4pAJtZe/XMXRJLbnGzqa0+H7nZ1HRE7efd3z5itxb9cZEDygoAlIwvPLoWqXajpP2DZXBNs1pynV8/Ow6VAcNDAwAAJdPzbN98SW8KnUPS0T0DT1wSOgSGhgYg9Gi/0QMAJHVf+/oZZvbx4OekjYeZLuq5+rCDcv+DI3OVvw3w5adgAUDxWRr/q5mNCJ1jMzUzu1zScaGDoDlMAACgJLqveePRZvbm0Dm25PJj+695QxGWJNCEyk8AGAAAKIsoso/KPXSMrUoVfUzSHaFzoHFMAACgBHquPmx3ub81dI7tOJEHBJULDQAAlEAURbNV7KltzSJ7R+gQaBwNQAF20TZ08E4BleaWHhf8PLTDw47N728AWaOsAEAp2JGhE+yYsxGwRGgAAKDg1l49cxdJu4bO0YDd11x/+KTQIdCYIq8ntQZ3AQAouNrIEVM9DZ2iMbXUpkpaGToHdowJAAAUXJrYhNAZGuVRUpqsVccEQOYqxRzAO/sWHD47dAoAQbzBvQSnKUmRrB46AxpDA2DaIGlk6Bg7Zm906frQKQAEUo76L5evC50Bjan8EoBJL4bOAADtIlLcEzoDGlP5BsCl9aEzAEC7SNy7Q2dAY1gCMPVK2jl0DABoBzV3JgAlUfkJgKSnQgcAgDaRjpKeDh0Cjal8A2DSY6EzAECbeNJOu6s/dAg0pvJLAG72mFTMr9cEgHKxR0InQOMqPwGQ+6OhIwBAW3CnASgRJgA13W1pSW6wBYACc9OS0BnQuMpPAMbed9cySWtC5wCAsotrtUWhM6BxlW8AbL5Smd0dOgcAlJrpidEn/+KPoWOgcZVfApAkue6Q6fjQMQCgvHxh6ARoTuUnAJLkUfq90BkAoMzM7EehM6A5NACS6m+/60Ez/S50DgAoqbWj1/uPQ4dAc1gC2MilG2W6KHQOACgd8wU8AKh8mABslKa6RjwRCACalppdHToDmkcDsFHHOxYvNem20DkAoGQeqt+zeFHoEGgeSwCbcUVfkqXHhc4BAGXhpn+x+UpD50DzeATeZtxl/T848iGX9gudBQBK4Mkxf1o31c5dsiF0EDSPJYDNmMlTt8+EzgEApWB2KcW/vJgAbMFd1vfDI38t6fWhswBAgf12zLPrDqEBKC8mAFswk0eKPho6BwAUWSo/n+JfbjQAWzH65Dtul3Rj6BwAUEQuXddx8mLumio57gLYBveB91pUO0rSbqGzAECBrIiUfiR0CAwfE4BtqP/1r56T6ZzQOQCgQFzu7x7ztrueDh0Ew0cDsB1j/8cvfyD5f4TOAQBF4KYvjj158U2hcyAbLAHswJh+f3/fWDtQrkNDZwGAcOzXY/tWXRg6BbLDBGAH7LS7+l0jTpb0ROgsABDIo55sONlOW7Y+dBBkh+cANKj7B0dOjyJbLGlc6CwA0EIvxKajdvrvdz4SOgiyRQPQhP6b3zQrTf1HMtVDZwGAFlgri44ee9Iv7g0dBNljCaAJo0+643aZHyNpZegsAJCz55TaMRT/9sUEYAh6f3LEoUqjWyRNCp0FADLntjyOkhN2Omnxo6GjID80AEO07pbDpyVp/D1JM0JnAYDMuH7tAxtOrv/1r54LHQX5YglgiHY64a7lY0bXDpe0IHQWAMiAu+vLY3pXvYniXw1MAIbJXdZ/81EXuOnTkkaHzgMAzbMVks8be9KdPwydBK1DA5CRdbe+ed+BJP2GSbNCZwGARrnZddGGgY/weN/qoQHIkLus75Yj3yPZpyXtEjoPAGzHb1OPzu846Rd8q19F0QDk4IWbjuwYMyK6QKYPSxofOg8AbOYxyT8/Ztf+b9jrl2wIHQbh0ADkaM0th0+qacSHpfRsyXYPnQdApf3W5Z8du0v/NRR+SDQALeHXTx/ZP37Sye7+HsmOE3dfAGiNNZJ9N5VdWf+v22+3+UpDB0Jx0AC0WN/NR+/p8cBJcjtJ0vGSxobOBKCtPCHXQov0o9Ej4x/ZMYvWhQ6EYqIBCMhvPnHUurj3MDe9zuUHK9UhMh0gaVTobAAKz2V6Qq7fS/aIlC6JYy3a6fg7/xA6GMqBBqCAVi08ekK8bsPuI2q2q7t2lVQLnQlAWO7eEynuTZX2xrFWjYprz3B1DwAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABAO/n/zQ22mk1xcx4AAAAASUVORK5CYII="
 )
 
+# Decoded once at import; the installer compares and writes these bytes.
+_ICON_BYTES = base64.b64decode(ICON_DATA)
+_ICON_SHA256 = hashlib.sha256(_ICON_BYTES).digest()
+
 # Module-level UI instance
 _ui_instance = None
 
 
+# ---------------------------------------------------------------------------
+# Scene helpers
+# ---------------------------------------------------------------------------
+def _obj_exists(name):
+    """Return True if *name* resolves to a node in the scene.
+
+    Equivalent to ``cmds.objExists`` for plain node names, but resolved
+    through an OpenMaya selection list instead of a command dispatch.
+    """
+    if not name:
+        return False
+    try:
+        om.MSelectionList().add(name)
+    except RuntimeError:
+        return False
+    return True
+
+
+def _rename_without_undo(node, new_name):
+    """``cmds.rename`` that leaves no entry on the undo queue.
+
+    Used for the cam_main rename and its restore, which the export pairs
+    up itself; recording them would only grow the user's undo queue.
+    """
+    undo_on = cmds.undoInfo(query=True, stateWithoutFlush=True)
+    cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        return cmds.rename(node, new_name)
+    finally:
+        cmds.undoInfo(stateWithoutFlush=undo_on)
+
+
 # ---------------------------------------------------------------------------
 # VersionParser
 # ---------------------------------------------------------------------------
@@ -152,10 +206,9 @@ class FolderManager(object):
     @staticmethod
     def ensure_directories(paths):
         """Create all necessary directories for the given paths."""
-        for fmt, file_path in paths.items():
-            dir_path = os.path.dirname(file_path)
-            if not os.path.exists(dir_path):
-                os.makedirs(dir_path)
+        # Several formats share a folder; create each one only once.
+        for dir_path in {os.path.dirname(p) for p in paths.values()}:
+            os.makedirs(dir_path, exist_ok=True)
 
     @staticmethod
     def build_ae_export_paths(export_root, scene_base_name, version_str, geo_names):
@@ -192,8 +245,7 @@ class FolderManager(object):
     def ensure_ae_directories(ae_paths):
         """Create the AE subfolder if needed."""
         ae_dir = os.path.dirname(ae_paths["jsx"])
-        if not os.path.exists(ae_dir):
-            os.makedirs(ae_dir)
+        os.makedirs(ae_dir, exist_ok=True)
 
     @staticmethod
     def resolve_versioned_dir(export_root, scene_base_name, version_str):
@@ -263,8 +315,21 @@ class FolderManager(object):
 class Exporter(object):
     """Handles exporting to each format."""
 
-    def __init__(self, log_callback):
+    def __init__(self, log_callback, interactive=True):
         self.log = log_callback
+        # False for scripted/batch runs: alerts are logged, not shown.
+        self.interactive = interactive
+
+    def _alert(self, title, message):
+        """Show a blocking error dialog, or only log it when scripted."""
+        if not self.interactive:
+            self.log("{}: {}".format(title, " ".join(message.split())))
+            return
+        cmds.confirmDialog(
+            title=title,
+            message=_EXPORT_HEADER + message,
+            button=["OK"],
+        )
 
     def _log_error(self, tag, exception):
         """Dump a verbose, readable error report to Maya's Script Editor
@@ -424,17 +489,23 @@ class Exporter(object):
             return ffmpeg_path
         return None
 
-    def _encode_mp4(self, png_dir, png_base, start_frame, output_mp4):
-        """Encode a PNG image sequence to H.264 .mp4 via bundled ffmpeg.
+    def _start_mp4_encode(self, frame_dir, frame_base, start_frame,
+                          output_mp4):
+        """Launch ffmpeg on a temp image sequence without waiting for it.
+
+        ffmpeg runs as its own process, so the rest of the export can go
+        on while it encodes; _finish_mp4_encode collects the result.  Its
+        stderr goes to a log file in *frame_dir* rather than a pipe, so a
+        long encode can never stall on a full pipe nobody is reading.
 
         Args:
-            png_dir: Directory containing the PNG sequence.
-            png_base: Base filename without frame number or extension.
+            frame_dir: Directory containing the _MP4_FRAME_FORMAT sequence.
+            frame_base: Base filename without frame number or extension.
             start_frame: First frame number in the sequence.
             output_mp4: Full path to the output .mp4 file.
 
         Returns:
-            bool: True if encoding succeeded.
+            subprocess.Popen or None if ffmpeg could not be started.
         """
         ffmpeg_path = self._find_ffmpeg()
         if not ffmpeg_path:
@@ -444,19 +515,21 @@ class Exporter(object):
                     os.path.join(
                         os.path.dirname(os.path.abspath(__file__)),
                         "bin", "win", "ffmpeg.exe")))
-            return False
+            return None
 
         fps = self._get_fps()
         seq_pattern = os.path.join(
-            png_dir, "{}.%04d.png".format(png_base))
+            frame_dir, "{}.%04d.{}".format(frame_base, _MP4_FRAME_FORMAT))
 
         cmd = [
             ffmpeg_path,
             "-y",
             "-framerate", str(fps),
             "-start_number", str(int(start_frame)),
+            "-f", "image2",
             "-i", seq_pattern,
             "-c:v", "libx264",
+            "-threads", "0",
             "-pix_fmt", "yuv420p",
             "-profile:v", "high",
             "-level", "4.2",
@@ -468,35 +541,70 @@ class Exporter(object):
 
         self.log("[Playblast] Encoding MP4 via ffmpeg...")
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600,
-                creationflags=getattr(
-                    subprocess, "CREATE_NO_WINDOW", 0),
-            )
-            if result.returncode != 0:
-                self.log(
-                    "[Playblast] ffmpeg FAILED (exit {}): {}".format(
-                        result.returncode,
-                        result.stderr[-500:] if result.stderr else ""))
-                return False
-            self.log("[Playblast] MP4 encoding complete.")
-            return True
-        except subprocess.TimeoutExpired:
-            self.log("[Playblast] ffmpeg timed out (600s).")
-            return False
+            with open(os.path.join(frame_dir, "ffmpeg.log"), "w") as err:
+                return subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=err,
+                    creationflags=getattr(
+                        subprocess, "CREATE_NO_WINDOW", 0),
+                )
         except Exception as e:
             self.log("[Playblast] ffmpeg error: {}".format(e))
+            return None
+
+    def _finish_mp4_encode(self, proc, frame_dir, timeout=600, abort=False):
+        """Wait for an encode from _start_mp4_encode and report it.
+
+        The temp frames are removed on success and kept for inspection
+        otherwise.  *timeout* counts from collection, so time spent on
+        other exports meanwhile never cuts a healthy encode short.
+        With *abort* the encode is killed and its frames removed, for an
+        export that failed before the encode was collected.
+
+        Returns:
+            bool: True if encoding succeeded.
+        """
+        if abort:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            self.log("[Playblast] MP4 encoding aborted.")
+            self._cleanup_temp_frames(frame_dir)
             return False
 
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            self.log("[Playblast] ffmpeg timed out ({}s).".format(timeout))
+            returncode = None
+
+        if returncode == 0:
+            self.log("[Playblast] MP4 encoding complete.")
+            self._cleanup_temp_frames(frame_dir)
+            return True
+        if returncode is not None:
+            try:
+                with open(os.path.join(frame_dir, "ffmpeg.log")) as f:
+                    stderr = f.read()
+            except OSError:
+                stderr = ""
+            self.log(
+                "[Playblast] ffmpeg FAILED (exit {}): {}".format(
+                    returncode, stderr[-500:]))
+        self.log(
+            "[Playblast] Temp frames preserved at: {}".format(frame_dir))
+        return False
+
     @staticmethod
-    def _cleanup_temp_pngs(png_dir):
-        """Delete a temporary PNG sequence directory."""
-        if os.path.isdir(png_dir):
+    def _cleanup_temp_frames(frame_dir):
+        """Delete a temporary image sequence directory."""
+        if os.path.isdir(frame_dir):
             try:
-                shutil.rmtree(png_dir)
+                shutil.rmtree(frame_dir)
             except Exception:
                 pass
 
@@ -513,6 +621,60 @@ class Exporter(object):
         return (node_long[0] == ancestor_long[0]
                 or node_long[0].startswith(ancestor_long[0] + "|"))
 
+    @staticmethod
+    def _ancestor_paths(long_name):
+        """Return the full paths of *long_name* and each of its DAG parents.
+
+        e.g. "|grp|sub|cam" -> {"|grp", "|grp|sub", "|grp|sub|cam"}
+        """
+        parts = long_name.split("|")
+        return {"|".join(parts[:i]) for i in range(2, len(parts) + 1)}
+
+    @staticmethod
+    def _camera_ancestors(camera):
+        """Return _ancestor_paths for *camera*, or an empty set if missing.
+
+        Lets callers drop every geo child that is (or contains) the camera
+        with a set lookup instead of a per-child _is_descendant_of query.
+        """
+        camera_long = cmds.ls(camera, long=True) if camera else None
+        if not camera_long:
+            return set()
+        return Exporter._ancestor_paths(camera_long[0])
+
+    @staticmethod
+    def _direct_transform_children(root, include_root=False):
+        """Return (name, full_path) pairs for *root*'s transform children.
+
+        With *include_root*, a root without transform children is returned
+        as its own single entry (it is then the only geo).
+
+        Walks the root's direct children through OpenMaya rather than two
+        listRelatives calls (short names, then full paths).
+        """
+        sel = om.MSelectionList()
+        try:
+            sel.add(root)
+            root_dag = sel.getDagPath(0)
+        except RuntimeError:
+            return []
+
+        pairs = []
+        for i in range(root_dag.childCount()):
+            child = root_dag.child(i)
+            if not child.hasFn(om.MFn.kTransform):
+                continue
+            # Extend the root path so instanced children stay under root
+            child_dag = om.MDagPath(root_dag)
+            child_dag.push(child)
+            pairs.append(
+                (child_dag.partialPathName(), child_dag.fullPathName()))
+        if pairs:
+            return pairs
+        if include_root:
+            return [(root, root_dag.fullPathName())]
+        return []
+
     def export_ma(self, file_path, camera, geo_roots, rig_roots, proxy_geos,
                   start_frame=None, end_frame=None):
         """Export selection as Maya ASCII.
@@ -651,16 +813,12 @@ class Exporter(object):
                     cmds.loadPlugin("fbxmaya")
                 except Exception:
                     self.log("[FBX] fbxmaya plugin is not available.")
-                    cmds.confirmDialog(
-                        title="FBX Plugin Not Found",
-                        message=(
-                            "Export Genie {}\n\n"
-                            "The FBX plugin (fbxmaya) could not be loaded.\n\n"
-                            "To enable it, go to:\n"
-                            "Windows > Settings/Preferences > Plug-in Manager\n\n"
-                            "Find 'fbxmaya' in the list and check 'Loaded'."
-                        ).format(TOOL_VERSION),
-                        button=["OK"],
+                    self._alert(
+                        "FBX Plugin Not Found",
+                        "The FBX plugin (fbxmaya) could not be loaded.\n\n"
+                        "To enable it, go to:\n"
+                        "Windows > Settings/Preferences > Plug-in Manager\n\n"
+                        "Find 'fbxmaya' in the list and check 'Loaded'.",
                     )
                     return False
 
@@ -744,16 +902,13 @@ class Exporter(object):
                     cmds.loadPlugin("AbcExport")
                 except Exception:
                     self.log("[ABC] AbcExport plugin is not available.")
-                    cmds.confirmDialog(
-                        title="Alembic Plugin Not Found",
-                        message=(
-                            "Export Genie {}\n\n"
-                            "The Alembic plugin (AbcExport) could not be loaded.\n\n"
-                            "To enable it, go to:\n"
-                            "Windows > Settings/Preferences > Plug-in Manager\n\n"
-                            "Find 'AbcExport' in the list and check 'Loaded'."
-                        ).format(TOOL_VERSION),
-                        button=["OK"],
+                    self._alert(
+                        "Alembic Plugin Not Found",
+                        "The Alembic plugin (AbcExport) could not be "
+                        "loaded.\n\n"
+                        "To enable it, go to:\n"
+                        "Windows > Settings/Preferences > Plug-in Manager\n\n"
+                        "Find 'AbcExport' in the list and check 'Loaded'.",
                     )
                     return False
 
@@ -1556,7 +1711,8 @@ class Exporter(object):
                          msaa_16=False,
                          png_mode=False,
                          mp4_mode=False,
-                         mp4_output=None):
+                         mp4_output=None,
+                         defer_encode=False):
         """Export a QC playblast at 1920x1080.
 
         Supports H.264 .mov (via QuickTime), PNG image sequence, or
@@ -1580,10 +1736,13 @@ class Exporter(object):
                 shader.
             png_mode: If True, exports PNG image sequence instead of
                 H.264 .mov.  Skips QuickTime validation.
-            mp4_mode: If True, playblasts to temp PNG sequence then
+            mp4_mode: If True, playblasts to temp BMP sequence then
                 encodes to H.264 .mp4 via bundled ffmpeg (Windows only).
             mp4_output: Full path to the output .mp4 file.  Required
                 when mp4_mode is True.
+            defer_encode: With mp4_mode, return as soon as ffmpeg has
+                started, handing back a callable that waits for the
+                encode and returns its success flag.
         """
         matchmove_geo = [
             g for g in (matchmove_geo or []) if g and cmds.objExists(g)
@@ -1594,26 +1753,22 @@ class Exporter(object):
             if mp4_mode:
                 pb_format = "image"
                 if not self._find_ffmpeg():
-                    cmds.confirmDialog(
-                        title="Cannot Create QC Movie",
-                        message=(
-                            "Export Genie {}\n\n"
-                            "ffmpeg.exe was not found.\n\n"
-                            "The H.264 (.mp4 Win) format requires "
-                            "ffmpeg.exe to be installed alongside "
-                            "this script.\n\n"
-                            "How to fix:\n"
-                            "Re-install Export Genie by dragging the "
-                            ".py file (from the folder containing "
-                            "bin/) into Maya's viewport.\n\n"
-                            "Expected location:\n"
-                            "{}".format(
-                                TOOL_VERSION,
-                                os.path.join(
-                                    os.path.dirname(
-                                        os.path.abspath(__file__)),
-                                    "bin", "win", "ffmpeg.exe"))),
-                        button=["OK"],
+                    self._alert(
+                        "Cannot Create QC Movie",
+                        "ffmpeg.exe was not found.\n\n"
+                        "The H.264 (.mp4 Win) format requires "
+                        "ffmpeg.exe to be installed alongside "
+                        "this script.\n\n"
+                        "How to fix:\n"
+                        "Re-install Export Genie by dragging the "
+                        ".py file (from the folder containing "
+                        "bin/) into Maya's viewport.\n\n"
+                        "Expected location:\n"
+                        "{}".format(
+                            os.path.join(
+                                os.path.dirname(
+                                    os.path.abspath(__file__)),
+                                "bin", "win", "ffmpeg.exe")),
                     )
                     return False
                 self.log(
@@ -1672,12 +1827,7 @@ class Exporter(object):
                             "Go to Windows > Settings/Preferences > "
                             "Plug-in Manager and check that media "
                             "plugins are loaded.")
-                    cmds.confirmDialog(
-                        title="Cannot Create QC Movie",
-                        message="Export Genie {}\n\n{}".format(
-                            TOOL_VERSION, msg),
-                        button=["OK"],
-                    )
+                    self._alert("Cannot Create QC Movie", msg)
                     return False
 
             # Find a visible model panel for the playblast.
@@ -2255,16 +2405,15 @@ class Exporter(object):
                     cmds.refresh(force=True)
 
                 if mp4_mode:
-                    # H.264 MP4 via ffmpeg: playblast temp PNGs, encode
-                    png_dir = os.path.dirname(file_path)
-                    if not os.path.exists(png_dir):
-                        os.makedirs(png_dir)
+                    # H.264 MP4 via ffmpeg: playblast temp frames, encode
+                    frame_dir = os.path.dirname(file_path)
+                    os.makedirs(frame_dir, exist_ok=True)
                     self.log(
-                        "[Playblast] Writing temp PNG sequence...")
+                        "[Playblast] Writing temp frame sequence...")
                     cmds.playblast(
                         filename=file_path,
                         format="image",
-                        compression="png",
+                        compression=_MP4_FRAME_FORMAT,
                         startTime=start_frame,
                         endTime=end_frame,
                         forceOverwrite=True,
@@ -2277,21 +2426,21 @@ class Exporter(object):
                         quality=100,
                         widthHeight=[1920, 1080],
                     )
-                    png_base = os.path.basename(file_path)
-                    encode_ok = self._encode_mp4(
-                        png_dir, png_base, start_frame, mp4_output)
-                    if encode_ok:
-                        self._cleanup_temp_pngs(png_dir)
-                    else:
+                    frame_base = os.path.basename(file_path)
+                    proc = self._start_mp4_encode(
+                        frame_dir, frame_base, start_frame, mp4_output)
+                    if proc is None:
                         self.log(
-                            "[Playblast] Temp PNGs preserved at: "
-                            "{}".format(png_dir))
-                    return encode_ok
+                            "[Playblast] Temp frames preserved at: "
+                            "{}".format(frame_dir))
+                        return False
+                    finish = partial(
+                        self._finish_mp4_encode, proc, frame_dir)
+                    return finish if defer_encode else finish()
                 elif png_mode:
                     # PNG image sequence
                     png_dir = os.path.dirname(file_path)
-                    if not os.path.exists(png_dir):
-                        os.makedirs(png_dir)
+                    os.makedirs(png_dir, exist_ok=True)
                     cmds.playblast(
                         filename=file_path,
                         format="image",
@@ -3180,6 +3329,14 @@ class Exporter(object):
             )
             scene_base = VersionParser.get_scene_base_name(scene_short)
 
+            # Resolve the camera's full path once — descendant tests and
+            # image plane lookups below reuse it instead of re-resolving.
+            camera_fp = None
+            if camera:
+                long_names = cmds.ls(camera, long=True)
+                if long_names:
+                    camera_fp = long_names[0]
+
             jsx_lines = []
 
             # Header
@@ -3216,18 +3373,15 @@ class Exporter(object):
 
             # Export OBJs and generate null layers
             if geo_root:
-                children = cmds.listRelatives(
-                    geo_root, children=True, type="transform"
-                ) or []
-                if not children:
-                    # geo_root itself is the only geo
-                    children = [geo_root]
+                # geo_root itself is the only geo if it has no children
+                pairs = self._direct_transform_children(
+                    geo_root, include_root=True)
                 # Skip camera (and its parent groups) from geo children
-                if camera:
-                    children = [
-                        c for c in children
-                        if not self._is_descendant_of(camera, c)
-                    ]
+                cam_ancestors = (
+                    self._ancestor_paths(camera_fp) if camera_fp else set())
+                children = [
+                    c for c, c_fp in pairs if c_fp not in cam_ancestors
+                ]
                 for child in children:
                     child_lower = child.lower()
 
@@ -3279,8 +3433,8 @@ class Exporter(object):
                     jsx_lines.extend(geo_jsx)
 
             # Source footage (from camera image plane, added last = bottom layer)
-            if camera:
-                img_path = self._get_image_plane_path(camera)
+            if camera_fp:
+                img_path = self._get_image_plane_path(camera_fp)
                 if img_path:
                     # Make path relative to JSX file location when possible
                     try:
@@ -3307,13 +3461,186 @@ class Exporter(object):
             return False
 
 
+# ---------------------------------------------------------------------------
+# ExportSettings
+# ---------------------------------------------------------------------------
+# Snapshot of every UI value an export pipeline reads, gathered in one
+# pass before the export starts.  Fields a tab does not use keep their
+# defaults (e.g. rig_roots on Camera Track, wf_shader on Matchmove).
+ExportSettings = namedtuple("ExportSettings", [
+    "export_root", "scene_base", "version_str",
+    "start_frame", "end_frame", "tpose_start",
+    "camera", "geo_roots", "rig_roots", "proxy_geos", "static_geo",
+    "do_ma", "do_jsx", "do_fbx", "do_abc", "do_mov",
+    "fmt_choice", "qc_mode", "raw_pb", "raw_srgb", "wf_shader", "aa16",
+    "chk_scale", "chk_color", "chk_opacity",
+])
+ExportSettings.__new__.__defaults__ = (
+    None, (), (), (), "",                 # camera .. static_geo
+    False, False, False, False, False,    # do_*
+    "", "mov", False, False, False, False,  # fmt_choice .. aa16
+    None, None, None,                     # chk_*
+)
+
+# One export format in a tab's pipeline.  The builder is called as
+# builder(exporter, settings, paths) when getattr(settings, enabled_attr)
+# is true and returns the success flag (or a callable returning it, for
+# work left running in the background); progress_steps is how many
+# progress-bar ticks it accounts for (the last tick is the pipeline's).
+ExportFormatSpec = namedtuple("ExportFormatSpec", [
+    "name", "enabled_attr", "label", "builder", "progress_steps",
+])
+ExportFormatSpec.__new__.__defaults__ = (1,)
+
+
+# ---------------------------------------------------------------------------
+# DynamicFieldList
+# ---------------------------------------------------------------------------
+class DynamicFieldList(object):
+    """A growable column of << Load Sel picker rows with +/- buttons.
+
+    Each row holds one textFieldButtonGrp per field spec.  Widgets are
+    kept column-wise: *handles* maps each spec key to a flat list of
+    field names (one per row) and *rows* holds the row layouts, so
+    callers walk a single list instead of a dict per row.
+    """
+
+    def __init__(self, ui, specs, noun, column_widths, row_height=30):
+        """
+        Args:
+            ui: Owning MultiExportUI (selection loading, window resize).
+            specs: List of (key, label, role, annotation) per field.
+            noun: Used in the +/- annotations, e.g. "geo group".
+            column_widths: columnWidth3 for each textFieldButtonGrp.
+            row_height: Window height added/removed per row.
+        """
+        self.ui = ui
+        self.specs = specs
+        self.noun = noun
+        self.column_widths = column_widths
+        self.row_height = row_height
+        self.handles = {spec[0]: [] for spec in specs}
+        self.rows = []
+        self.container = None
+        self.rows_layout = None
+        self.btn_row = None
+        self.add_btn = None
+        self.minus_btn = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def build(self):
+        """Create the container under the current parent plus the first row."""
+        self.container = cmds.columnLayout(
+            adjustableColumn=True, rowSpacing=4
+        )
+        self.rows_layout = cmds.columnLayout(
+            adjustableColumn=True, rowSpacing=4
+        )
+        cmds.setParent("..")  # out of rows layout
+
+        # +/- buttons are created once and stay below the rows
+        self.btn_row = cmds.rowLayout(
+            numberOfColumns=3,
+            columnWidth3=(70, 30, 30),
+            columnAlign3=("right", "center", "center"),
+        )
+        cmds.text(label="")
+        self.add_btn = cmds.button(
+            label="+", width=26,
+            command=self.add,
+            annotation="Add another {}".format(self.noun),
+        )
+        self.minus_btn = cmds.button(
+            label="-", width=26,
+            visible=False,
+            command=self.remove,
+            annotation="Remove the last {}".format(self.noun),
+        )
+        cmds.setParent("..")  # out of rowLayout
+        cmds.setParent("..")  # out of container
+
+        self.add()
+
+    def add(self, *args):
+        """Append a row above the +/- buttons."""
+        idx = len(self.rows) + 1
+        suffix = "" if idx == 1 else " {}".format(idx)
+
+        parent = cmds.setParent(query=True)
+        cmds.setParent(self.rows_layout)
+        row = cmds.columnLayout(adjustableColumn=True, rowSpacing=4)
+
+        for key, label, role, annotation in self.specs:
+            field = cmds.textFieldButtonGrp(
+                label="{}{}:".format(label, suffix),
+                buttonLabel="<< Load Sel",
+                columnWidth3=self.column_widths,
+                editable=False,
+                annotation=annotation,
+            )
+            cmds.textFieldButtonGrp(
+                field, edit=True,
+                buttonCommand=partial(
+                    self.ui._load_selection_into, field, role),
+            )
+            self.handles[key].append(field)
+
+        cmds.setParent(parent)
+        self.rows.append(row)
+        self._update_buttons()
+
+        if len(self.rows) > 1:
+            self.ui._grow_window(self.row_height)
+
+    def remove(self, *args):
+        """Delete the last row (the first row is always kept)."""
+        if len(self.rows) <= 1:
+            return
+
+        cmds.deleteUI(self.rows.pop())
+        for fields in self.handles.values():
+            fields.pop()
+        self._update_buttons()
+        self.ui._grow_window(-self.row_height)
+
+    def _update_buttons(self):
+        """Show the minus button only while more than one row exists."""
+        cmds.button(
+            self.minus_btn, edit=True, visible=(len(self.rows) >= 2)
+        )
+
+
 # ---------------------------------------------------------------------------
 # MultiExportUI
 # ---------------------------------------------------------------------------
 class MultiExportUI(object):
     """Main UI window built with maya.cmds — two-tab layout."""
 
-    def __init__(self):
+    # Shown in the "not a transform" dialog when loading a selection
+    _ROLE_LABELS = {
+        "geo": "geo group/root",
+        "rig": "rig root",
+        "proxy": "static geo root",
+    }
+
+    # QC playblast options mirrored into _pb_state:
+    # (settings key, widget attr suffix, cmds widget command, query flag)
+    _PB_OPTIONS = (
+        ("fmt_choice", "mov_format_menu", "optionMenu", "value"),
+        ("raw_pb", "raw_playblast_cb", "checkBox", "value"),
+        ("raw_srgb", "raw_srgb_cb", "checkBox", "value"),
+        ("aa16", "aa16_cb", "checkBox", "value"),
+        ("chk_scale", "checker_scale", "intSliderGrp", "value"),
+        ("chk_color", "checker_color", "colorSliderGrp", "rgbValue"),
+        ("chk_opacity", "checker_opacity", "intSliderGrp", "value"),
+    )
+
+    def __init__(self, interactive=True):
+        # False for scripted/batch runs: results go to the log, no dialogs.
+        self._interactive = interactive
+        self._last_results = {}           # {format: success} of last export
         self.window = None
         self.tab_layout = None
         # Shared
@@ -3321,18 +3648,28 @@ class MultiExportUI(object):
         self.version_text = None
         self.export_root_field = None
         self.version_field = None
+        self._scene_info_cache = None     # scene path last shown in the UI
+        self._scene_base_cache = (None, None)  # (scene path, scene base)
         self.start_frame_field = None
         self.end_frame_field = None
         self.tpose_checkbox = None
         self.tpose_frame_field = None
         self.log_field = None
+        self._log_len = 0                 # running length of the log text
+        self._log_buffer = deque()        # lines not yet written to the field
+        self._log_deferred = False        # buffer lines until next redraw
         self.progress_bar = None
         self.progress_label = None
+        self._field_map = {}              # (tab, role) -> fixed picker field
+        self._pending_height_delta = 0    # queued window resize (pixels)
+        self._height_flush_scheduled = False
+        self._last_refresh_t = 0.0        # monotonic time of last redraw
+        # Exporter keeps no per-export state, so one instance is reused
+        self._exporter = Exporter(self._log, interactive)
+        self._pb_state = {}               # tab prefix -> QC option values
         # Camera Track tab (ct_)
         self.ct_camera_field = None
-        self.ct_geo_fields = []
-        self.ct_geo_container = None
-        self.ct_geo_btn_row = None
+        self.ct_geo_fields = None         # DynamicFieldList
         self.ct_ma_checkbox = None
         self.ct_jsx_checkbox = None
         self.ct_fbx_checkbox = None
@@ -3345,14 +3682,8 @@ class MultiExportUI(object):
         self.ct_aa16_cb = None
         # Matchmove tab (mm_)
         self.mm_camera_field = None
-        self.mm_static_geo_fields = []
-        self.mm_static_geo_container = None
-        self.mm_static_geo_btn_row = None
-        self.mm_rig_geo_pairs = []        # [{"rig_field", "geo_field", "row"}]
-        self.mm_rig_geo_container = None  # columnLayout for dynamic pairs
-        self.mm_btn_row = None            # +/- button row (rebuilt dynamically)
-        self.mm_add_btn = None
-        self.mm_minus_btn = None
+        self.mm_static_geo_fields = None  # DynamicFieldList
+        self.mm_rig_geo_pairs = None      # DynamicFieldList, rig_field/geo_field
         self.mm_ma_checkbox = None
         self.mm_fbx_checkbox = None
         self.mm_abc_checkbox = None
@@ -3412,6 +3743,17 @@ class MultiExportUI(object):
         )
         cmds.setParent("..")
 
+        for prefix in ("ct", "mm", "ft"):
+            self._track_playblast_options(prefix)
+
+        # Fixed (tab, role) -> field lookup for the non-dynamic pickers
+        self._field_map = {
+            ("ct", "camera"): self.ct_camera_field,
+            ("mm", "camera"): self.mm_camera_field,
+            ("ft", "camera"): self.ft_camera_field,
+            ("ft", "proxy"): self.ft_static_geo_field,
+        }
+
         # --- Shared: Frame Range ---
         self._build_frame_range()
 
@@ -3454,9 +3796,13 @@ class MultiExportUI(object):
         # Populate scene info and auto-refresh on scene open/save
         self._refresh_scene_info()
         self._scene_jobs = []
-        for event in ("SceneOpened", "SceneSaved", "NewSceneOpened"):
+        for event, callback in (
+            ("SceneOpened", self._on_scene_changed),
+            ("SceneSaved", self._refresh_scene_info),
+            ("NewSceneOpened", self._on_scene_changed),
+        ):
             job_id = cmds.scriptJob(
-                event=[event, self._refresh_scene_info],
+                event=[event, callback],
                 parent=self.window,
             )
             self._scene_jobs.append(job_id)
@@ -3536,15 +3882,13 @@ class MultiExportUI(object):
         )
 
         # --- Dynamic geo group fields + buttons ---
-        self.ct_geo_fields = []
-        self.ct_geo_btn_row = None
-        self.ct_geo_container = cmds.columnLayout(
-            adjustableColumn=True, rowSpacing=4
+        self.ct_geo_fields = DynamicFieldList(
+            self,
+            [("field", "Geo Group", "geo",
+              "Select a top-level geo group to export")],
+            "geo group", (70, 260, 80),
         )
-        cmds.setParent("..")  # out of container
-
-        # Add first geo field and buttons
-        self._add_ct_geo_field()
+        self.ct_geo_fields.build()
 
         cmds.setParent("..")
         cmds.setParent("..")
@@ -3662,29 +4006,27 @@ class MultiExportUI(object):
         )
 
         # --- Dynamic static geo fields + buttons ---
-        self.mm_static_geo_fields = []
-        self.mm_static_geo_btn_row = None
-        self.mm_static_geo_container = cmds.columnLayout(
-            adjustableColumn=True, rowSpacing=4
+        self.mm_static_geo_fields = DynamicFieldList(
+            self,
+            [("field", "Static Geo", "proxy",
+              "Select static/proxy geometry group")],
+            "static geo group", (70, 260, 80),
         )
-        cmds.setParent("..")  # out of container
-
-        # Add first static geo field and buttons
-        self._add_mm_static_geo_field()
+        self.mm_static_geo_fields.build()
 
         # --- Separator ---
         cmds.separator(style="in", height=12)
 
         # --- Dynamic rig/geo pairs + buttons (all inside container) ---
-        self.mm_rig_geo_pairs = []
-        self.mm_btn_row = None
-        self.mm_rig_geo_container = cmds.columnLayout(
-            adjustableColumn=True, rowSpacing=4
+        self.mm_rig_geo_pairs = DynamicFieldList(
+            self,
+            [("rig_field", "Main Rig Group", "rig",
+              "Select the control rig group"),
+             ("geo_field", "Mesh Group", "geo",
+              "Select the animated geo group")],
+            "rig/geo pair", (90, 240, 80), row_height=52,
         )
-        cmds.setParent("..")  # out of container
-
-        # Add first pair and buttons
-        self._add_rig_geo_pair()
+        self.mm_rig_geo_pairs.build()
 
         cmds.setParent("..")  # out of inner columnLayout
         cmds.setParent("..")  # out of frameLayout "Node Picker"
@@ -3864,15 +4206,12 @@ class MultiExportUI(object):
         cmds.separator(style="in", height=12)
 
         # --- Dynamic face mesh entries + buttons (all inside container) ---
-        self.ft_face_mesh_entries = []
-        self.ft_btn_row = None
-        self.ft_face_mesh_container = cmds.columnLayout(
-            adjustableColumn=True, rowSpacing=4
+        self.ft_face_mesh_entries = DynamicFieldList(
+            self,
+            [("field", "Face Mesh", "geo", "Select a face mesh to export")],
+            "face mesh entry", (90, 240, 80),
         )
-        cmds.setParent("..")  # out of container
-
-        # Add first face mesh entry and buttons
-        self._add_face_mesh_entry()
+        self.ft_face_mesh_entries.build()
 
         cmds.setParent("..")  # out of inner columnLayout
         cmds.setParent("..")  # out of frameLayout "Node Picker"
@@ -4018,6 +4357,7 @@ class MultiExportUI(object):
         self.log_field = cmds.scrollField(
             editable=False, wordWrap=True, height=120, text=""
         )
+        self._log_len = 0
         cmds.setParent("..")
 
     # --- Tab Helpers ---
@@ -4031,6 +4371,56 @@ class MultiExportUI(object):
             return TAB_MATCHMOVE
         return TAB_FACE_TRACK
 
+    def _track_playblast_options(self, prefix):
+        """Mirror a tab's QC playblast widgets into self._pb_state.
+
+        Seeds the cache from the freshly built widgets and keeps it
+        current through changeCommand, so an export reads a dict instead
+        of querying every widget.
+        """
+        self._pb_state[prefix] = {}
+        for option in self._PB_OPTIONS:
+            key, suffix, command = option[:3]
+            widget = getattr(self, "{}_{}".format(prefix, suffix), None)
+            if not widget:
+                continue  # e.g. no checker overlay on Camera Track
+            self._store_pb_option(
+                prefix, key, self._query_pb_option(widget, option))
+            getattr(cmds, command)(
+                widget, edit=True,
+                changeCommand=partial(
+                    self._on_pb_option_changed, prefix, widget, option),
+            )
+
+    @staticmethod
+    def _query_pb_option(widget, option):
+        """Return the current value of one QC playblast widget."""
+        key, _, command, flag = option
+        value = getattr(cmds, command)(widget, query=True, **{flag: True})
+        return tuple(value) if key == "chk_color" else value
+
+    def _on_pb_option_changed(self, prefix, widget, option, *args):
+        # Re-query rather than trust *args: their shape differs per
+        # widget type (colorSliderGrp passes none at all).
+        self._store_pb_option(
+            prefix, option[0], self._query_pb_option(widget, option))
+
+    def _store_pb_option(self, prefix, key, value):
+        """Cache one QC option; the format label is classified here once."""
+        state = self._pb_state[prefix]
+        state[key] = value
+        if key == "fmt_choice":
+            state["qc_mode"] = self._classify_qc_format(value)
+
+    @staticmethod
+    def _classify_qc_format(label):
+        """Map a QC format menu label to "png", "mp4" or "mov"."""
+        if "PNG" in label:
+            return "png"
+        if ".mp4" in label:
+            return "mp4"
+        return "mov"
+
     # --- Callbacks ---
 
     def _browse_export_root(self, *args):
@@ -4049,12 +4439,12 @@ class MultiExportUI(object):
             target_field: The textFieldButtonGrp widget to populate.
             role: "camera", "geo", "rig", or "proxy" — drives validation.
         """
-        sel = cmds.ls(selection=True, long=False)
+        sel = cmds.ls(selection=True, long=False, head=1)
         if not sel:
             cmds.confirmDialog(
                 title="No Selection",
-                message="Export Genie {}\n\nNothing is selected. Please select an object first.".format(
-                    TOOL_VERSION),
+                message=(_EXPORT_HEADER + "Nothing is selected. "
+                         "Please select an object first."),
                 button=["OK"],
             )
             return
@@ -4063,33 +4453,26 @@ class MultiExportUI(object):
 
         # Validate based on role
         if role == "camera":
-            shapes = cmds.listRelatives(obj, shapes=True, type="camera") or []
-            if not shapes:
-                if cmds.nodeType(obj) == "camera":
-                    parents = cmds.listRelatives(obj, parent=True)
-                    if parents:
-                        obj = parents[0]
-                else:
-                    cmds.confirmDialog(
-                        title="Invalid Selection",
-                        message="Export Genie {}\n\n'{}' is not a camera. Please select a camera.".format(
-                            TOOL_VERSION, obj),
-                        button=["OK"],
-                    )
-                    return
+            cam_xform = self._camera_transform_of(obj)
+            if not cam_xform:
+                cmds.confirmDialog(
+                    title="Invalid Selection",
+                    message=_EXPORT_HEADER + (
+                        "'{}' is not a camera. "
+                        "Please select a camera.".format(obj)),
+                    button=["OK"],
+                )
+                return
+            obj = cam_xform
         else:
             # geo, rig, proxy — must be a transform
             if cmds.nodeType(obj) != "transform":
-                role_labels = {
-                    "geo": "geo group/root",
-                    "rig": "rig root",
-                    "proxy": "static geo root",
-                }
                 cmds.confirmDialog(
                     title="Invalid Selection",
-                    message="Export Genie {}\n\n'{}' is not a transform node. Please select the {}.".format(
-                        TOOL_VERSION, obj, role_labels.get(role, role)
-                    ),
+                    message=_EXPORT_HEADER + (
+                        "'{}' is not a transform node. "
+                        "Please select the {}.".format(
+                            obj, self._ROLE_LABELS.get(role, role))),
                     button=["OK"],
                 )
                 return
@@ -4100,17 +4483,37 @@ class MultiExportUI(object):
         if role == "camera":
             self._set_frame_range_from_camera(obj)
 
+    @staticmethod
+    def _camera_transform_of(obj):
+        """Return the camera transform for *obj*, or None if not a camera.
+
+        Accepts either the transform or the camera shape itself.  Walks
+        the DAG through OpenMaya so the shape check needs no extra
+        listRelatives/nodeType round-trips.
+        """
+        sel = om.MSelectionList()
+        try:
+            sel.add(obj)
+            dag = sel.getDagPath(0)
+        except RuntimeError:
+            return None
+
+        if dag.node().hasFn(om.MFn.kCamera):
+            dag.pop()  # shape selected -> use its transform
+            return dag.partialPathName()
+        for i in range(dag.childCount()):
+            if dag.child(i).hasFn(om.MFn.kCamera):
+                return obj
+        return None
+
     def _set_frame_range_from_camera(self, cam_xform):
         """Set start frame to 1001 and end frame from the camera's last key."""
-        # Query all keyframes on the camera transform's TRS channels
-        keys = cmds.keyframe(cam_xform, query=True, timeChange=True) or []
-        # Also check the camera shape (focal length, etc.)
+        # One keyframe query covers the transform and its camera shape
+        # (focal length, etc.); None/empty means nothing is keyed.
         shapes = cmds.listRelatives(
             cam_xform, shapes=True, type="camera") or []
-        for shp in shapes:
-            shp_keys = cmds.keyframe(
-                shp, query=True, timeChange=True) or []
-            keys.extend(shp_keys)
+        keys = cmds.keyframe(
+            [cam_xform] + shapes, query=True, timeChange=True) or []
         if keys:
             last_frame = int(max(keys))
             cmds.intField(
@@ -4125,436 +4528,151 @@ class MultiExportUI(object):
             tab_prefix: "ct" for Camera Track, "mm" for Matchmove, "ft" for Face Track.
             role: "camera", "geo", "rig", or "proxy".
         """
-        if tab_prefix == "ct":
-            field_map = {
-                "camera": self.ct_camera_field,
-            }
-        elif tab_prefix == "ft":
-            field_map = {
-                "camera": self.ft_camera_field,
-                "proxy": self.ft_static_geo_field,
-            }
-        else:
-            field_map = {
-                "camera": self.mm_camera_field,
-            }
-
-        target_field = field_map.get(role)
+        target_field = self._field_map.get((tab_prefix, role))
         if not target_field:
             return
 
         self._load_selection_into(target_field, role)
 
-    # --- Camera Track dynamic geo group fields ---
+    def _grow_window(self, delta):
+        """Queue a resize by *delta* pixels to fit added/removed rows.
 
-    def _rebuild_ct_geo_buttons(self):
-        """Recreate the +/- button row at the bottom of the CT geo container."""
-        if self.ct_geo_btn_row:
-            cmds.deleteUI(self.ct_geo_btn_row)
-            self.ct_geo_btn_row = None
-
-        cmds.setParent(self.ct_geo_container)
-        self.ct_geo_btn_row = cmds.rowLayout(
-            numberOfColumns=3,
-            columnWidth3=(70, 30, 30),
-            columnAlign3=("right", "center", "center"),
-        )
-        cmds.text(label="")
-        cmds.button(
-            label="+", width=26,
-            command=partial(self._add_ct_geo_field),
-            annotation="Add another geo group",
-        )
-        cmds.button(
-            label="-", width=26,
-            visible=(len(self.ct_geo_fields) >= 2),
-            command=partial(self._remove_ct_geo_field),
-            annotation="Remove the last geo group",
-        )
-        cmds.setParent("..")  # out of rowLayout
-        cmds.setParent("..")  # out of container
+        Consecutive changes are summed and applied in one window edit at
+        the next idle, so rapid +/- clicks cause a single relayout.
+        """
+        self._pending_height_delta += delta
+        if not self._height_flush_scheduled:
+            self._height_flush_scheduled = True
+            cmds.evalDeferred(self._flush_height)
+
+    def _flush_height(self):
+        delta = self._pending_height_delta
+        self._pending_height_delta = 0
+        self._height_flush_scheduled = False
+        if not delta or not cmds.window(self.window, exists=True):
+            return
+        cur_h = cmds.window(self.window, query=True, height=True)
+        cmds.window(self.window, edit=True, height=cur_h + delta)
 
-    def _add_ct_geo_field(self, *args):
-        """Add a new Geo Group picker field to the camera track tab."""
-        if self.ct_geo_btn_row:
-            cmds.deleteUI(self.ct_geo_btn_row)
-            self.ct_geo_btn_row = None
+    def _set_timeline_range(self, *args):
+        start = cmds.playbackOptions(query=True, animationStartTime=True)
+        end = cmds.playbackOptions(query=True, animationEndTime=True)
+        cmds.intField(self.start_frame_field, edit=True,
+                       value=max(int(start), 1001))
+        cmds.intField(self.end_frame_field, edit=True, value=int(end))
 
-        idx = len(self.ct_geo_fields) + 1
-        suffix = "" if idx == 1 else " {}".format(idx)
+    def _on_tpose_toggled(self, checked, *args):
+        """When Include T Pose is toggled (no longer modifies start frame).
 
-        cmds.setParent(self.ct_geo_container)
-        row = cmds.columnLayout(adjustableColumn=True, rowSpacing=4)
+        The T-pose frame is handled internally during export — FBX and ABC
+        extend their range to include the T-pose, while .ma and QC playblast
+        keep the original timeline range.
+        """
+        pass
 
-        field = cmds.textFieldButtonGrp(
-            label="Geo Group{}:".format(suffix),
-            buttonLabel="<< Load Sel",
-            columnWidth3=(70, 260, 80),
-            editable=False,
-            annotation="Select a top-level geo group to export",
-        )
-        cmds.textFieldButtonGrp(
-            field, edit=True,
-            buttonCommand=partial(self._load_selection_into, field, "geo"),
-        )
+    def _on_tpose_frame_changed(self, value, *args):
+        """When the T-pose frame number changes (no UI side-effects)."""
+        pass
 
-        cmds.setParent("..")  # out of row columnLayout
-        cmds.setParent("..")  # out of container
+    def _on_scene_changed(self):
+        """Drop the cached scene info after an open/new and redisplay it."""
+        self._scene_info_cache = None
+        self._scene_base_cache = (None, None)
+        self._refresh_scene_info()
 
-        self.ct_geo_fields.append({
-            "field": field,
-            "row": row,
-        })
+    def _get_scene_base(self, scene_path):
+        """Return the scene base name, re-derived only for a new path.
 
-        self._rebuild_ct_geo_buttons()
+        The path key also covers a Save As; _on_scene_changed clears it.
+        """
+        if self._scene_base_cache[0] != scene_path:
+            self._scene_base_cache = (
+                scene_path,
+                VersionParser.get_scene_base_name(
+                    os.path.basename(scene_path)),
+            )
+        return self._scene_base_cache[1]
 
-        if len(self.ct_geo_fields) > 1:
-            cur_h = cmds.window(self.window, query=True, height=True)
-            cmds.window(self.window, edit=True, height=cur_h + 30)
+    def _refresh_scene_info(self):
+        scene_path = cmds.file(query=True, sceneName=True)
+        # Same scene as last time (e.g. a plain re-save): nothing to
+        # re-parse, and the version field keeps any manual edit.
+        if scene_path == self._scene_info_cache:
+            return
+        self._scene_info_cache = scene_path
+        if scene_path:
+            scene_short = os.path.basename(scene_path)
+            cmds.text(
+                self.scene_info_text,
+                edit=True,
+                label="Scene: " + scene_short,
+            )
+            ver_str, _ = VersionParser.parse(scene_short)
+            if ver_str:
+                cmds.text(
+                    self.version_text,
+                    edit=True,
+                    label="Version: {} (detected)".format(ver_str),
+                )
+                cmds.textFieldGrp(
+                    self.version_field, edit=True, text=ver_str)
+            else:
+                cmds.text(
+                    self.version_text,
+                    edit=True,
+                    label="Version: (none detected \u2014 will default to v01)",
+                )
+                cmds.textFieldGrp(
+                    self.version_field, edit=True, text="v01")
+        else:
+            cmds.text(
+                self.scene_info_text,
+                edit=True,
+                label="Scene: (unsaved scene)",
+            )
+            cmds.text(
+                self.version_text,
+                edit=True,
+                label="Version: (save scene first)",
+            )
+            cmds.textFieldGrp(
+                self.version_field, edit=True, text="v01")
 
-    def _remove_ct_geo_field(self, *args):
-        """Remove the last Geo Group picker field from camera track tab."""
-        if len(self.ct_geo_fields) <= 1:
+    def _log(self, message):
+        # While an export runs, lines are buffered and written out on the
+        # next progress redraw; otherwise they show up immediately.
+        self._log_buffer.append(message)
+        if not self._log_deferred:
+            self._flush_log()
+
+    def _log_batch(self, lines):
+        """Append several lines to the log with a single field edit."""
+        self._log_buffer.extend(lines)
+        if not self._log_deferred:
+            self._flush_log()
+
+    def _flush_log(self):
+        """Append all buffered lines to the log field in one edit."""
+        if not self._log_buffer:
             return
+        chunk = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        # Append in place rather than round-tripping the whole buffer;
+        # the running length replaces a text query for the scroll.
+        if self._log_len:
+            chunk = "\n" + chunk
+        cmds.scrollField(self.log_field, edit=True, insertionPosition=0)
+        cmds.scrollField(self.log_field, edit=True, insertText=chunk)
+        self._log_len += len(chunk)
+        cmds.scrollField(
+            self.log_field, edit=True, insertionPosition=self._log_len
+        )
 
-        entry = self.ct_geo_fields.pop()
-        cmds.deleteUI(entry["row"])
-
-        self._rebuild_ct_geo_buttons()
-
-        cur_h = cmds.window(self.window, query=True, height=True)
-        cmds.window(self.window, edit=True, height=cur_h - 30)
-
-    # --- Matchmove dynamic rig/geo pairs ---
-
-    def _rebuild_rig_geo_buttons(self):
-        """Recreate the +/- button row at the bottom of the rig/geo container."""
-        if self.mm_btn_row:
-            cmds.deleteUI(self.mm_btn_row)
-            self.mm_btn_row = None
-
-        cmds.setParent(self.mm_rig_geo_container)
-        self.mm_btn_row = cmds.rowLayout(
-            numberOfColumns=3,
-            columnWidth3=(70, 30, 30),
-            columnAlign3=("right", "center", "center"),
-        )
-        cmds.text(label="")
-        self.mm_add_btn = cmds.button(
-            label="+", width=26,
-            command=partial(self._add_rig_geo_pair),
-            annotation="Add another rig/geo pair",
-        )
-        self.mm_minus_btn = cmds.button(
-            label="-", width=26,
-            visible=(len(self.mm_rig_geo_pairs) >= 2),
-            command=partial(self._remove_rig_geo_pair),
-            annotation="Remove the last rig/geo pair",
-        )
-        cmds.setParent("..")  # out of rowLayout
-        cmds.setParent("..")  # out of container
-
-    def _add_rig_geo_pair(self, *args):
-        """Add a new Main Rig Group / Mesh Group pair to the matchmove tab."""
-        # Remove button row so the new pair is inserted before it
-        if self.mm_btn_row:
-            cmds.deleteUI(self.mm_btn_row)
-            self.mm_btn_row = None
-
-        idx = len(self.mm_rig_geo_pairs) + 1
-        suffix = "" if idx == 1 else " {}".format(idx)
-
-        cmds.setParent(self.mm_rig_geo_container)
-        row = cmds.columnLayout(adjustableColumn=True, rowSpacing=4)
-
-        rig_field = cmds.textFieldButtonGrp(
-            label="Main Rig Group{}:".format(suffix),
-            buttonLabel="<< Load Sel",
-            columnWidth3=(90, 240, 80),
-            editable=False,
-            annotation="Select the control rig group",
-        )
-        cmds.textFieldButtonGrp(
-            rig_field, edit=True,
-            buttonCommand=partial(self._load_selection_into, rig_field, "rig"),
-        )
-
-        geo_field = cmds.textFieldButtonGrp(
-            label="Mesh Group{}:".format(suffix),
-            buttonLabel="<< Load Sel",
-            columnWidth3=(90, 240, 80),
-            editable=False,
-            annotation="Select the animated geo group",
-        )
-        cmds.textFieldButtonGrp(
-            geo_field, edit=True,
-            buttonCommand=partial(self._load_selection_into, geo_field, "geo"),
-        )
-
-        cmds.setParent("..")  # out of row columnLayout
-        cmds.setParent("..")  # out of container
-
-        self.mm_rig_geo_pairs.append({
-            "rig_field": rig_field,
-            "geo_field": geo_field,
-            "row": row,
-        })
-
-        # Rebuild buttons at the bottom
-        self._rebuild_rig_geo_buttons()
-
-        # Grow window to fit new pair
-        if len(self.mm_rig_geo_pairs) > 1:
-            cur_h = cmds.window(self.window, query=True, height=True)
-            cmds.window(self.window, edit=True, height=cur_h + 52)
-
-    def _remove_rig_geo_pair(self, *args):
-        """Remove the last Main Rig Group / Mesh Group pair."""
-        if len(self.mm_rig_geo_pairs) <= 1:
-            return
-
-        entry = self.mm_rig_geo_pairs.pop()
-        cmds.deleteUI(entry["row"])
-
-        # Rebuild buttons (updates minus visibility)
-        self._rebuild_rig_geo_buttons()
-
-        # Shrink window
-        cur_h = cmds.window(self.window, query=True, height=True)
-        cmds.window(self.window, edit=True, height=cur_h - 52)
-
-    # --- Matchmove dynamic static geo fields ---
-
-    def _rebuild_mm_static_geo_buttons(self):
-        """Recreate the +/- button row at the bottom of the MM static geo container."""
-        if self.mm_static_geo_btn_row:
-            cmds.deleteUI(self.mm_static_geo_btn_row)
-            self.mm_static_geo_btn_row = None
-
-        cmds.setParent(self.mm_static_geo_container)
-        self.mm_static_geo_btn_row = cmds.rowLayout(
-            numberOfColumns=3,
-            columnWidth3=(70, 30, 30),
-            columnAlign3=("right", "center", "center"),
-        )
-        cmds.text(label="")
-        cmds.button(
-            label="+", width=26,
-            command=partial(self._add_mm_static_geo_field),
-            annotation="Add another static geo group",
-        )
-        cmds.button(
-            label="-", width=26,
-            visible=(len(self.mm_static_geo_fields) >= 2),
-            command=partial(self._remove_mm_static_geo_field),
-            annotation="Remove the last static geo group",
-        )
-        cmds.setParent("..")  # out of rowLayout
-        cmds.setParent("..")  # out of container
-
-    def _add_mm_static_geo_field(self, *args):
-        """Add a new Static Geo picker field to the matchmove tab."""
-        if self.mm_static_geo_btn_row:
-            cmds.deleteUI(self.mm_static_geo_btn_row)
-            self.mm_static_geo_btn_row = None
-
-        idx = len(self.mm_static_geo_fields) + 1
-        suffix = "" if idx == 1 else " {}".format(idx)
-
-        cmds.setParent(self.mm_static_geo_container)
-        row = cmds.columnLayout(adjustableColumn=True, rowSpacing=4)
-
-        field = cmds.textFieldButtonGrp(
-            label="Static Geo{}:".format(suffix),
-            buttonLabel="<< Load Sel",
-            columnWidth3=(70, 260, 80),
-            editable=False,
-            annotation="Select static/proxy geometry group",
-        )
-        cmds.textFieldButtonGrp(
-            field, edit=True,
-            buttonCommand=partial(self._load_selection_into, field, "proxy"),
-        )
-
-        cmds.setParent("..")  # out of row columnLayout
-        cmds.setParent("..")  # out of container
-
-        self.mm_static_geo_fields.append({
-            "field": field,
-            "row": row,
-        })
-
-        self._rebuild_mm_static_geo_buttons()
-
-        if len(self.mm_static_geo_fields) > 1:
-            cur_h = cmds.window(self.window, query=True, height=True)
-            cmds.window(self.window, edit=True, height=cur_h + 30)
-
-    def _remove_mm_static_geo_field(self, *args):
-        """Remove the last Static Geo picker field from matchmove tab."""
-        if len(self.mm_static_geo_fields) <= 1:
-            return
-
-        entry = self.mm_static_geo_fields.pop()
-        cmds.deleteUI(entry["row"])
-
-        self._rebuild_mm_static_geo_buttons()
-
-        cur_h = cmds.window(self.window, query=True, height=True)
-        cmds.window(self.window, edit=True, height=cur_h - 30)
-
-    # --- Face Track dynamic face mesh entries ---
-
-    def _rebuild_face_mesh_buttons(self):
-        """Recreate the +/- button row at the bottom of the face mesh container."""
-        if self.ft_btn_row:
-            cmds.deleteUI(self.ft_btn_row)
-            self.ft_btn_row = None
-
-        cmds.setParent(self.ft_face_mesh_container)
-        self.ft_btn_row = cmds.rowLayout(
-            numberOfColumns=3,
-            columnWidth3=(70, 30, 30),
-            columnAlign3=("right", "center", "center"),
-        )
-        cmds.text(label="")
-        self.ft_add_btn = cmds.button(
-            label="+", width=26,
-            command=partial(self._add_face_mesh_entry),
-            annotation="Add another face mesh entry",
-        )
-        self.ft_minus_btn = cmds.button(
-            label="-", width=26,
-            visible=(len(self.ft_face_mesh_entries) >= 2),
-            command=partial(self._remove_face_mesh_entry),
-            annotation="Remove the last face mesh entry",
-        )
-        cmds.setParent("..")  # out of rowLayout
-        cmds.setParent("..")  # out of container
-
-    def _add_face_mesh_entry(self, *args):
-        """Add a new Face Mesh picker field to the face track tab."""
-        if self.ft_btn_row:
-            cmds.deleteUI(self.ft_btn_row)
-            self.ft_btn_row = None
-
-        idx = len(self.ft_face_mesh_entries) + 1
-        suffix = "" if idx == 1 else " {}".format(idx)
-
-        cmds.setParent(self.ft_face_mesh_container)
-        row = cmds.columnLayout(adjustableColumn=True, rowSpacing=4)
-
-        field = cmds.textFieldButtonGrp(
-            label="Face Mesh{}:".format(suffix),
-            buttonLabel="<< Load Sel",
-            columnWidth3=(90, 240, 80),
-            editable=False,
-            annotation="Select a face mesh to export",
-        )
-        cmds.textFieldButtonGrp(
-            field, edit=True,
-            buttonCommand=partial(self._load_selection_into, field, "geo"),
-        )
-
-        cmds.setParent("..")  # out of row columnLayout
-        cmds.setParent("..")  # out of container
-
-        self.ft_face_mesh_entries.append({
-            "field": field,
-            "row": row,
-        })
-
-        self._rebuild_face_mesh_buttons()
-
-        if len(self.ft_face_mesh_entries) > 1:
-            cur_h = cmds.window(self.window, query=True, height=True)
-            cmds.window(self.window, edit=True, height=cur_h + 30)
-
-    def _remove_face_mesh_entry(self, *args):
-        """Remove the last Face Mesh picker field."""
-        if len(self.ft_face_mesh_entries) <= 1:
-            return
-
-        entry = self.ft_face_mesh_entries.pop()
-        cmds.deleteUI(entry["row"])
-
-        self._rebuild_face_mesh_buttons()
-
-        cur_h = cmds.window(self.window, query=True, height=True)
-        cmds.window(self.window, edit=True, height=cur_h - 30)
-
-    def _set_timeline_range(self, *args):
-        start = cmds.playbackOptions(query=True, animationStartTime=True)
-        end = cmds.playbackOptions(query=True, animationEndTime=True)
-        cmds.intField(self.start_frame_field, edit=True,
-                       value=max(int(start), 1001))
-        cmds.intField(self.end_frame_field, edit=True, value=int(end))
-
-    def _on_tpose_toggled(self, checked, *args):
-        """When Include T Pose is toggled (no longer modifies start frame).
-
-        The T-pose frame is handled internally during export — FBX and ABC
-        extend their range to include the T-pose, while .ma and QC playblast
-        keep the original timeline range.
-        """
-        pass
-
-    def _on_tpose_frame_changed(self, value, *args):
-        """When the T-pose frame number changes (no UI side-effects)."""
-        pass
-
-    def _refresh_scene_info(self):
-        scene_path = cmds.file(query=True, sceneName=True)
-        if scene_path:
-            scene_short = cmds.file(
-                query=True, sceneName=True, shortName=True
-            )
-            cmds.text(
-                self.scene_info_text,
-                edit=True,
-                label="Scene: " + scene_short,
-            )
-            ver_str, _ = VersionParser.parse(scene_short)
-            if ver_str:
-                cmds.text(
-                    self.version_text,
-                    edit=True,
-                    label="Version: {} (detected)".format(ver_str),
-                )
-                cmds.textFieldGrp(
-                    self.version_field, edit=True, text=ver_str)
-            else:
-                cmds.text(
-                    self.version_text,
-                    edit=True,
-                    label="Version: (none detected \u2014 will default to v01)",
-                )
-                cmds.textFieldGrp(
-                    self.version_field, edit=True, text="v01")
-        else:
-            cmds.text(
-                self.scene_info_text,
-                edit=True,
-                label="Scene: (unsaved scene)",
-            )
-            cmds.text(
-                self.version_text,
-                edit=True,
-                label="Version: (save scene first)",
-            )
-            cmds.textFieldGrp(
-                self.version_field, edit=True, text="v01")
-
-    def _log(self, message):
-        current = cmds.scrollField(self.log_field, query=True, text=True)
-        if current:
-            updated = current + "\n" + message
-        else:
-            updated = message
-        cmds.scrollField(self.log_field, edit=True, text=updated)
-        cmds.scrollField(
-            self.log_field, edit=True, insertionPosition=len(updated)
-        )
+    def _clear_log(self):
+        cmds.scrollField(self.log_field, edit=True, text="")
+        self._log_len = 0
+        self._log_buffer.clear()
+        self._log_deferred = False
 
     def _log_result(self, label, success):
         """Append a single-line task result to the log.
@@ -4579,7 +4697,9 @@ class MultiExportUI(object):
         cmds.text(
             self.progress_label, edit=True, label="0%", visible=True
         )
-        cmds.refresh(force=True)
+        # No forced redraw here; the first _advance_progress paints it.
+        self._last_refresh_t = 0.0
+        self._log_deferred = True
 
     def _advance_progress(self):
         """Advance the progress bar by one step."""
@@ -4594,12 +4714,20 @@ class MultiExportUI(object):
             self.progress_label, edit=True,
             label="{}%".format(min(pct, 100))
         )
-        cmds.refresh(force=True)
+        # A forced refresh redraws the viewports too, so throttle it to
+        # ~10 Hz and let Maya's event loop coalesce the widget repaints.
+        now = time.monotonic()
+        if pct >= 100 or now - self._last_refresh_t > 0.1:
+            self._flush_log()
+            cmds.refresh(force=True)
+            self._last_refresh_t = now
 
     def _hide_progress(self):
         """Hide the progress bar after export completes."""
         cmds.progressBar(self.progress_bar, edit=True, visible=False)
         cmds.text(self.progress_label, edit=True, visible=False)
+        self._log_deferred = False
+        self._flush_log()
 
     # --- Validation ---
 
@@ -4636,16 +4764,10 @@ class MultiExportUI(object):
         if end_frame <= start_frame:
             errors.append("End frame must be greater than start frame.")
 
-        version_str = cmds.textFieldGrp(
-            self.version_field, query=True, text=True).strip()
-        if not version_str:
-            version_str = None
+        version_str = self._resolve_version(default=None)
         scene_base = None
         if scene_path:
-            scene_short = cmds.file(
-                query=True, sceneName=True, shortName=True
-            )
-            scene_base = VersionParser.get_scene_base_name(scene_short)
+            scene_base = self._get_scene_base(scene_path)
             if not version_str:
                 warnings.append(
                     "Version Num field is empty.\n"
@@ -4666,25 +4788,29 @@ class MultiExportUI(object):
         do_abc = cmds.checkBox(self.ct_abc_checkbox, query=True, value=True)
         do_mov = cmds.checkBox(self.ct_mov_checkbox, query=True, value=True)
         if not (do_ma or do_jsx or do_fbx or do_abc or do_mov):
+            # Nothing would be exported, so the field checks are moot.
             errors.append("No export format selected.")
+            return errors, warnings
 
         camera = cmds.textFieldButtonGrp(
             self.ct_camera_field, query=True, text=True
         ).strip()
 
+        # (label, name) of every assigned node, built while gathering and
+        # reused for the existence and name-collision checks below.
+        assigned = [("Camera", camera)] if camera else []
+
         # Gather all geo group fields
         geo_roots = []
-        for i, entry in enumerate(self.ct_geo_fields):
+        for i, field in enumerate(self.ct_geo_fields.handles["field"]):
             g = cmds.textFieldButtonGrp(
-                entry["field"], query=True, text=True
+                field, query=True, text=True
             ).strip()
             if g:
+                suffix = "" if i == 0 else " {}".format(i + 1)
                 geo_roots.append(g)
-            suffix = "" if i == 0 else " {}".format(i + 1)
-            if g and not cmds.objExists(g):
-                errors.append(
-                    "Geo Group{} '{}' no longer exists in the scene.".format(
-                        suffix, g))
+                assigned.append(("Geo Group{}".format(suffix), g))
+        missing = self._check_assigned_exist(errors, assigned)
 
         has_geo = bool(geo_roots)
         if do_ma and not camera and not has_geo:
@@ -4704,23 +4830,12 @@ class MultiExportUI(object):
                 "Alembic export enabled but no Camera or Geo Node assigned."
             )
 
-        if camera and not cmds.objExists(camera):
-            errors.append(
-                "Camera '{}' no longer exists in the scene.".format(camera)
-            )
-
         # Name-collision checks
-        assigned = []
-        if camera:
-            assigned.append(("Camera", camera))
-        for i, g in enumerate(geo_roots):
-            suffix = "" if i == 0 else " {}".format(i + 1)
-            assigned.append(("Geo Group{}".format(suffix), g))
         self._check_name_collisions(errors, assigned)
 
         if do_jsx:
             for g in geo_roots:
-                if g and cmds.objExists(g):
+                if g not in missing:
                     self._check_obj_name_collisions(errors, g, camera)
 
         return errors, warnings
@@ -4735,50 +4850,49 @@ class MultiExportUI(object):
         do_abc = cmds.checkBox(self.mm_abc_checkbox, query=True, value=True)
         do_mov = cmds.checkBox(self.mm_mov_checkbox, query=True, value=True)
         if not (do_ma or do_fbx or do_abc or do_mov):
+            # Nothing would be exported, so the field checks are moot.
             errors.append("No export format selected.")
+            return errors, warnings
 
         camera = cmds.textFieldButtonGrp(
             self.mm_camera_field, query=True, text=True
         ).strip()
 
+        # (label, name) of every assigned node, built while gathering and
+        # reused for the existence and name-collision checks below.
+        assigned = [("Camera", camera)] if camera else []
+
         # Gather all static geo fields
-        proxy_geos = []
-        for i, entry in enumerate(self.mm_static_geo_fields):
+        for i, field in enumerate(self.mm_static_geo_fields.handles["field"]):
             pg = cmds.textFieldButtonGrp(
-                entry["field"], query=True, text=True
+                field, query=True, text=True
             ).strip()
             if pg:
-                proxy_geos.append(pg)
-            suffix = "" if i == 0 else " {}".format(i + 1)
-            if pg and not cmds.objExists(pg):
-                errors.append(
-                    "Static Geo{} '{}' no longer exists in the scene.".format(
-                        suffix, pg))
+                suffix = "" if i == 0 else " {}".format(i + 1)
+                assigned.append(("Static Geo{}".format(suffix), pg))
 
         # Gather rig/geo pairs
         rig_roots = []
         geo_roots = []
-        for i, pair in enumerate(self.mm_rig_geo_pairs):
+        for i, (rig_field, geo_field) in enumerate(zip(
+                self.mm_rig_geo_pairs.handles["rig_field"],
+                self.mm_rig_geo_pairs.handles["geo_field"])):
             r = cmds.textFieldButtonGrp(
-                pair["rig_field"], query=True, text=True
+                rig_field, query=True, text=True
             ).strip()
             g = cmds.textFieldButtonGrp(
-                pair["geo_field"], query=True, text=True
+                geo_field, query=True, text=True
             ).strip()
+            suffix = "" if i == 0 else " {}".format(i + 1)
             if r:
                 rig_roots.append(r)
+                assigned.append(("Main Rig Group{}".format(suffix), r))
             if g:
                 geo_roots.append(g)
-            # Validate existence
-            suffix = "" if i == 0 else " {}".format(i + 1)
-            if r and not cmds.objExists(r):
-                errors.append(
-                    "Main Rig Group{} '{}' no longer exists in the scene.".format(
-                        suffix, r))
-            if g and not cmds.objExists(g):
-                errors.append(
-                    "Mesh Group{} '{}' no longer exists in the scene.".format(
-                        suffix, g))
+                assigned.append(("Mesh Group{}".format(suffix), g))
+
+        # Validate existence (one batched lookup for every assigned node)
+        self._check_assigned_exist(errors, assigned)
 
         if do_ma and not any(geo_roots + rig_roots + [camera]):
             errors.append(
@@ -4791,30 +4905,7 @@ class MultiExportUI(object):
         if do_abc and not geo_roots:
             errors.append("Alembic export enabled but no Mesh Group assigned.")
 
-        if camera and not cmds.objExists(camera):
-            errors.append(
-                "Camera '{}' no longer exists in the scene.".format(camera)
-            )
-
         # Name-collision checks
-        assigned = []
-        if camera:
-            assigned.append(("Camera", camera))
-        for i, pg in enumerate(proxy_geos):
-            suffix = "" if i == 0 else " {}".format(i + 1)
-            assigned.append(("Static Geo{}".format(suffix), pg))
-        for i, pair in enumerate(self.mm_rig_geo_pairs):
-            r = cmds.textFieldButtonGrp(
-                pair["rig_field"], query=True, text=True
-            ).strip()
-            g = cmds.textFieldButtonGrp(
-                pair["geo_field"], query=True, text=True
-            ).strip()
-            suffix = "" if i == 0 else " {}".format(i + 1)
-            if r:
-                assigned.append(("Main Rig Group{}".format(suffix), r))
-            if g:
-                assigned.append(("Mesh Group{}".format(suffix), g))
         self._check_name_collisions(errors, assigned)
 
         return errors, warnings
@@ -4828,7 +4919,9 @@ class MultiExportUI(object):
         do_fbx = cmds.checkBox(self.ft_fbx_checkbox, query=True, value=True)
         do_mov = cmds.checkBox(self.ft_mov_checkbox, query=True, value=True)
         if not (do_ma or do_fbx or do_mov):
+            # Nothing would be exported, so the field checks are moot.
             errors.append("No export format selected.")
+            return errors, warnings
 
         camera = cmds.textFieldButtonGrp(
             self.ft_camera_field, query=True, text=True
@@ -4837,19 +4930,22 @@ class MultiExportUI(object):
             self.ft_static_geo_field, query=True, text=True
         ).strip()
 
+        # (label, name) of every assigned node, built while gathering and
+        # reused for the existence and name-collision checks below.
+        assigned = [(label, name) for label, name in (
+            ("Camera", camera), ("Static Geo", static_geo)) if name]
+
         # Gather face meshes
         face_meshes = []
-        for i, entry in enumerate(self.ft_face_mesh_entries):
+        for i, field in enumerate(self.ft_face_mesh_entries.handles["field"]):
             fm = cmds.textFieldButtonGrp(
-                entry["field"], query=True, text=True
+                field, query=True, text=True
             ).strip()
             if fm:
+                suffix = "" if i == 0 else " {}".format(i + 1)
                 face_meshes.append(fm)
-            suffix = "" if i == 0 else " {}".format(i + 1)
-            if fm and not cmds.objExists(fm):
-                errors.append(
-                    "Face Mesh{} '{}' no longer exists in the scene.".format(
-                        suffix, fm))
+                assigned.append(("Face Mesh{}".format(suffix), fm))
+        self._check_assigned_exist(errors, assigned)
 
         if do_fbx and not face_meshes:
             errors.append(
@@ -4860,66 +4956,127 @@ class MultiExportUI(object):
                 "MA export enabled but no roles assigned (nothing to export)."
             )
 
-        for role_name, value in [
-            ("Camera", camera),
-            ("Static Geo", static_geo),
-        ]:
-            if value and not cmds.objExists(value):
-                errors.append(
-                    "{} '{}' no longer exists in the scene.".format(
-                        role_name, value
-                    )
-                )
-
         # Name-collision checks
-        assigned = []
-        if camera:
-            assigned.append(("Camera", camera))
-        if static_geo:
-            assigned.append(("Static Geo", static_geo))
-        for i, entry in enumerate(self.ft_face_mesh_entries):
-            fm = cmds.textFieldButtonGrp(
-                entry["field"], query=True, text=True
-            ).strip()
-            suffix = "" if i == 0 else " {}".format(i + 1)
-            if fm:
-                assigned.append(("Face Mesh{}".format(suffix), fm))
         self._check_name_collisions(errors, assigned)
 
         return errors, warnings
 
-    # --- Name-collision helpers ---
+    # --- Existence helpers ---
 
-    @staticmethod
-    def _check_name_collisions(errors, assigned_nodes):
-        """Detect duplicate picks and cam_main rename conflicts.
+    def _check_assigned_exist(self, errors, assigned):
+        """Report every assigned node that no longer exists.
 
-        Args:
-            errors: List to append error strings to.
-            assigned_nodes: List of (role_label, node_name) tuples.
+        Walks the same (label, name) list that the name-collision check
+        uses, resolving all names with one batched lookup.
+
+        Returns:
+            set: The missing names.
         """
-        # Duplicate picks — same node in two or more role fields.
-        seen = {}
-        for role, node in assigned_nodes:
-            if node in seen:
+        missing = self._find_missing_nodes([n for _, n in assigned])
+        for label, name in assigned:
+            if name in missing:
                 errors.append(
-                    "Name collision: '{}' is assigned to both {} and {}.".format(
-                        node, seen[node], role
-                    )
-                )
-            else:
-                seen[node] = role
+                    "{} '{}' no longer exists in the scene.".format(
+                        label, name))
+        return missing
 
-        # cam_main conflict — a different node already has that name.
-        cameras = [n for r, n in assigned_nodes if "camera" in r.lower()]
-        for cam in cameras:
-            if cam != "cam_main" and cmds.objExists("cam_main"):
+    @staticmethod
+    def _find_missing_nodes(names):
+        """Return the subset of *names* that do not exist in the scene.
+
+        Resolves every name with a single ``cmds.ls`` call instead of one
+        ``cmds.objExists`` per field.  ``ls`` may hand back a different
+        path form than the one typed (e.g. a short name that is not
+        unique), so only names it did not echo back get an individual
+        ``objExists`` fallback.
+        """
+        names = [n for n in names if n]
+        if not names:
+            return set()
+        found = set(cmds.ls(names) or [])
+        return {n for n in names
+                if n not in found and not cmds.objExists(n)}
+
+    @staticmethod
+    def _resolve_long_names(names):
+        """Map each name to a unique DAG path after namespace stripping.
+
+        Every name and its namespace-stripped leaf are resolved with a
+        single ``cmds.ls`` call; results are matched back by path suffix.
+        A name that still exists wins over its stripped leaf, and names
+        that match nothing map to themselves.
+        """
+        names = [n for n in names if n]
+        leaves = {n: n.rsplit(":", 1)[-1] for n in names}
+        found = cmds.ls(
+            sorted(set(names) | set(leaves.values())), long=True
+        ) or []
+
+        def lookup(name):
+            tail = "|" + name
+            for path in found:
+                if path == name or path.endswith(tail):
+                    return path
+            return None
+
+        return {n: lookup(n) or lookup(leaves[n]) or n for n in names}
+
+    def _resolve_camera_for_export(self, camera):
+        """Rename *camera* to cam_main for export.
+
+        Returns ``(camera, renamed_cam)``: the name to export under and
+        the node to rename back afterwards (None if nothing was renamed).
+        A missing camera logs a warning and comes back as None.
+        """
+        if not camera:
+            return camera, None
+        cam_main_exists = _obj_exists("cam_main")
+        if camera == "cam_main" and cam_main_exists:
+            # Already named correctly — no rename needed
+            return camera, None
+        if _obj_exists(camera):
+            renamed_cam = _rename_without_undo(camera, "cam_main")
+            return renamed_cam, renamed_cam
+        if cam_main_exists:
+            # Previous run may have renamed without restoring
+            return "cam_main", "cam_main"
+        self._log("[WARN] Camera '{}' not found.".format(camera))
+        return None, None
+
+    # --- Name-collision helpers ---
+
+    @staticmethod
+    def _check_name_collisions(errors, assigned_nodes):
+        """Detect duplicate picks and cam_main rename conflicts.
+
+        Args:
+            errors: List to append error strings to.
+            assigned_nodes: List of (role_label, node_name) tuples.
+        """
+        # Duplicate picks — same node in two or more role fields.
+        seen = {}
+        for role, node in assigned_nodes:
+            if node in seen:
                 errors.append(
-                    "Name collision: A node named 'cam_main' already exists. "
-                    "The camera will be renamed to 'cam_main' during export, "
-                    "which would conflict."
+                    "Name collision: '{}' is assigned to both {} and {}.".format(
+                        node, seen[node], role
+                    )
                 )
-                break
+            else:
+                seen[node] = role
+
+        # cam_main conflict — a different node already has that name.
+        # Every validator labels its camera exactly "Camera", so a plain
+        # comparison replaces the per-role lower()/substring test.
+        cameras = [n for r, n in assigned_nodes if r == "Camera"]
+        # The scene lookup is the same for every camera, so do it once.
+        if (any(cam != "cam_main" for cam in cameras)
+                and _obj_exists("cam_main")):
+            errors.append(
+                "Name collision: A node named 'cam_main' already exists. "
+                "The camera will be renamed to 'cam_main' during export, "
+                "which would conflict."
+            )
 
     @staticmethod
     def _check_obj_name_collisions(errors, geo_root, camera):
@@ -4930,31 +5087,23 @@ class MultiExportUI(object):
             geo_root: Top-level geo group node.
             camera: Camera node name (excluded from children).
         """
-        children = cmds.listRelatives(
-            geo_root, children=True, type="transform"
-        ) or []
-        if not children:
+        pairs = Exporter._direct_transform_children(geo_root)
+        if not pairs:
             return
 
         # Apply same filters used during export.
-        if camera:
-            children = [
-                c for c in children
-                if not Exporter._is_descendant_of(camera, c)
-            ]
+        cam_ancestors = Exporter._camera_ancestors(camera)
         children = [
-            c for c in children
-            if "chisels" not in c.lower()
-            and "nulls" not in c.lower()
+            c for c, c_fp in pairs
+            if c_fp not in cam_ancestors and not _GEO_SKIP_RE.search(c)
         ]
 
         # Check for duplicate short names.
-        name_count = {}
-        for c in children:
-            short = c.rsplit("|", 1)[-1].rsplit(":", 1)[-1]
-            name_count.setdefault(short, []).append(c)
-        for short, nodes in name_count.items():
-            if len(nodes) > 1:
+        counts = Counter(
+            c.rsplit("|", 1)[-1].rsplit(":", 1)[-1] for c in children
+        )
+        for short, n in counts.items():
+            if n > 1:
                 errors.append(
                     "Name collision: Multiple geo children share the "
                     "name '{}'. OBJ files would overwrite each other. "
@@ -4965,65 +5114,28 @@ class MultiExportUI(object):
 
     def _on_export(self, *args):
         """Main export callback — dispatches to active tab's export."""
-        cmds.scrollField(self.log_field, edit=True, text="")
+        self._clear_log()
 
         active_tab = self._get_active_tab()
-        if active_tab == TAB_CAMERA_TRACK:
-            self._export_camera_track()
-        elif active_tab == TAB_MATCHMOVE:
-            self._export_matchmove()
-        else:
-            self._export_face_track()
-
-    def _export_camera_track(self):
-        """Export pipeline for Camera Track tab."""
-        errors, warnings = self._validate_camera_track()
-        if errors:
-            for e in errors:
-                self._log(e)
-            cmds.confirmDialog(
-                title="Export Errors",
-                message="Export Genie {}\n\n{}".format(
-                    TOOL_VERSION, "\n\n".join(errors)),
-                button=["OK"],
-            )
-            return
-
-        if warnings:
-            result = cmds.confirmDialog(
-                title="Warnings",
-                message="Export Genie {}\n\n{}".format(
-                    TOOL_VERSION, "\n\n".join(warnings)),
-                button=["Continue", "Cancel"],
-                defaultButton="Continue",
-                cancelButton="Cancel",
-                dismissString="Cancel",
-            )
-            if result == "Cancel":
-                self._log("Export cancelled by user.")
-                return
+        try:
+            if active_tab == TAB_CAMERA_TRACK:
+                self._export_camera_track()
+            elif active_tab == TAB_MATCHMOVE:
+                self._export_matchmove()
+            else:
+                self._export_face_track()
+        finally:
+            # Never leave lines stuck in the buffer if an export aborts.
+            self._log_deferred = False
+            self._flush_log()
 
-        original_sel = cmds.ls(selection=True)
+    # --- Settings gathering ---
 
-        # Gather settings
+    def _gather_shared_settings(self):
+        """Query the settings every tab shares, once, as a kwargs dict."""
         export_root = cmds.textFieldButtonGrp(
             self.export_root_field, query=True, text=True
         ).strip()
-        camera = cmds.textFieldButtonGrp(
-            self.ct_camera_field, query=True, text=True
-        ).strip()
-        geo_roots = []
-        for entry in self.ct_geo_fields:
-            g = cmds.textFieldButtonGrp(
-                entry["field"], query=True, text=True
-            ).strip()
-            if g:
-                geo_roots.append(g)
-        do_ma = cmds.checkBox(self.ct_ma_checkbox, query=True, value=True)
-        do_jsx = cmds.checkBox(self.ct_jsx_checkbox, query=True, value=True)
-        do_fbx = cmds.checkBox(self.ct_fbx_checkbox, query=True, value=True)
-        do_abc = cmds.checkBox(self.ct_abc_checkbox, query=True, value=True)
-        do_mov = cmds.checkBox(self.ct_mov_checkbox, query=True, value=True)
         start_frame = cmds.intField(
             self.start_frame_field, query=True, value=True
         )
@@ -5032,207 +5144,132 @@ class MultiExportUI(object):
         )
 
         # Read version from UI field
-        scene_short = cmds.file(
-            query=True, sceneName=True, shortName=True
-        )
-        version_str = cmds.textFieldGrp(
-            self.version_field, query=True, text=True).strip()
-        if not version_str:
-            version_str = "v01"
-        scene_base = VersionParser.get_scene_base_name(scene_short)
+        scene_path = cmds.file(query=True, sceneName=True)
+        version_str = self._resolve_version()
+        scene_base = self._get_scene_base(scene_path)
 
-        # Resolve versioned directories (rename older version folders)
-        FolderManager.resolve_versioned_dir(
-            export_root, scene_base, version_str
-        )
-        main_dir = os.path.join(
-            export_root,
-            "{}_track_{}".format(scene_base, version_str),
+        return dict(
+            export_root=export_root, scene_base=scene_base,
+            version_str=version_str, start_frame=start_frame,
+            end_frame=end_frame, tpose_start=start_frame,
         )
-        FolderManager.resolve_ae_dir(main_dir, scene_base, version_str)
 
-        self._log("Export to: {}".format(main_dir))
-
-        exporter = Exporter(self._log)
-        results = {}
-        all_paths = {}
-
-        # Progress bar — JSX counts as 2 steps (setup + timeline scrub)
-        total_formats = sum([do_ma, do_fbx, do_abc, do_mov])
-        if do_jsx:
-            total_formats += 2
-        self._reset_progress(total_formats)
+    def _resolve_version(self, default="v01"):
+        """Return the Version Num field text, or *default* when empty."""
+        return cmds.textFieldGrp(
+            self.version_field, query=True, text=True).strip() or default
 
-        # Rename camera to cam_main for all exports
-        renamed_cam = None
-        original_cam_name = camera
-        try:
-            if camera:
-                if camera == "cam_main" and cmds.objExists(camera):
-                    # Already named correctly — no rename needed
-                    pass
-                elif cmds.objExists(camera):
-                    renamed_cam = cmds.rename(camera, "cam_main")
-                    camera = renamed_cam
-                elif cmds.objExists("cam_main"):
-                    # Previous run may have renamed without restoring
-                    renamed_cam = "cam_main"
-                    camera = "cam_main"
-                else:
-                    self._log(
-                        "[WARN] Camera '{}' not found.".format(camera))
-                    camera = None
-
-            # JSX + OBJ export
-            if do_jsx:
-                geo_children = []
-                for gr in geo_roots:
-                    children = cmds.listRelatives(
-                        gr, children=True, type="transform"
-                    ) or []
-                    if children:
-                        geo_children.extend(children)
-                    else:
-                        geo_children.append(gr)
-                # Exclude camera, chisels, and nulls from OBJ paths
-                # (nulls/locators are handled separately inside export_jsx)
-                if camera:
-                    geo_children = [
-                        c for c in geo_children
-                        if not Exporter._is_descendant_of(camera, c)
-                    ]
-                geo_children = [
-                    c for c in geo_children
-                    if "chisels" not in c.lower()
-                    and "nulls" not in c.lower()
-                ]
-
-                ae_paths = FolderManager.build_ae_export_paths(
-                    export_root, scene_base, version_str, geo_children
-                )
-                FolderManager.ensure_ae_directories(ae_paths)
-                all_paths["jsx"] = ae_paths["jsx"]
-                self._advance_progress()  # step 1: setup complete
-
-                # JSX export uses the first geo root as the primary group
-                jsx_geo_root = geo_roots[0] if geo_roots else None
-                results["jsx"] = exporter.export_jsx(
-                    ae_paths["jsx"], ae_paths["obj"], camera, jsx_geo_root,
-                    start_frame, end_frame
-                )
-                self._log_result("JSX + OBJ", results["jsx"])
-                self._advance_progress()  # step 2: JSX scrub complete
+    @staticmethod
+    def _query_fields(fields):
+        """Return the non-empty, stripped text of each picker field."""
+        return [
+            t for t in (
+                cmds.textFieldButtonGrp(f, query=True, text=True).strip()
+                for f in fields
+            ) if t
+        ]
 
-            if do_ma:
-                paths = FolderManager.build_export_paths(
-                    export_root, scene_base, version_str, tag="cam"
-                )
-                FolderManager.ensure_directories({"ma": paths["ma"]})
-                all_paths["ma"] = paths["ma"]
-                results["ma"] = exporter.export_ma(
-                    paths["ma"], camera, geo_roots, [], [],
-                    start_frame=start_frame, end_frame=end_frame,
-                )
-                self._log_result("MA", results["ma"])
-                self._advance_progress()
+    def _gather_playblast_settings(self, prefix, checker=True):
+        """Return the QC playblast options of one tab (ct/mm/ft).
 
-            if do_fbx:
-                paths = FolderManager.build_export_paths(
-                    export_root, scene_base, version_str, tag="cam"
-                )
-                FolderManager.ensure_directories({"fbx": paths["fbx"]})
-                all_paths["fbx"] = paths["fbx"]
-                results["fbx"] = exporter.export_fbx(
-                    paths["fbx"], camera, geo_roots, [], [],
-                    start_frame, end_frame
-                )
-                self._log_result("FBX", results["fbx"])
-                self._advance_progress()
+        Read from the _pb_state cache kept by _track_playblast_options.
+        """
+        opts = dict(self._pb_state[prefix])
+        if not checker:
+            for key in ("chk_scale", "chk_color", "chk_opacity"):
+                opts.pop(key, None)
+        return opts
+
+    def _gather_camera_track_settings(self):
+        """Snapshot the Camera Track tab into an ExportSettings."""
+        kwargs = self._gather_shared_settings()
+        kwargs.update(
+            camera=cmds.textFieldButtonGrp(
+                self.ct_camera_field, query=True, text=True).strip(),
+            geo_roots=self._query_fields(self.ct_geo_fields.handles["field"]),
+            do_ma=cmds.checkBox(self.ct_ma_checkbox, query=True, value=True),
+            do_jsx=cmds.checkBox(self.ct_jsx_checkbox, query=True, value=True),
+            do_fbx=cmds.checkBox(self.ct_fbx_checkbox, query=True, value=True),
+            do_abc=cmds.checkBox(self.ct_abc_checkbox, query=True, value=True),
+            do_mov=cmds.checkBox(self.ct_mov_checkbox, query=True, value=True),
+        )
+        if kwargs["do_mov"]:
+            kwargs.update(self._gather_playblast_settings("ct", checker=False))
+            kwargs["wf_shader"] = cmds.checkBox(
+                self.ct_wireframe_shader_cb, query=True, value=True)
+        return ExportSettings(**kwargs)
+
+    def _gather_matchmove_settings(self):
+        """Snapshot the Matchmove tab into an ExportSettings."""
+        kwargs = self._gather_shared_settings()
+        pairs = self.mm_rig_geo_pairs.handles
+        kwargs.update(
+            camera=cmds.textFieldButtonGrp(
+                self.mm_camera_field, query=True, text=True).strip(),
+            proxy_geos=self._query_fields(
+                self.mm_static_geo_fields.handles["field"]),
+            rig_roots=self._query_fields(pairs["rig_field"]),
+            geo_roots=self._query_fields(pairs["geo_field"]),
+            do_ma=cmds.checkBox(self.mm_ma_checkbox, query=True, value=True),
+            do_fbx=cmds.checkBox(self.mm_fbx_checkbox, query=True, value=True),
+            do_abc=cmds.checkBox(self.mm_abc_checkbox, query=True, value=True),
+            do_mov=cmds.checkBox(self.mm_mov_checkbox, query=True, value=True),
+        )
 
-            if do_abc:
-                paths = FolderManager.build_export_paths(
-                    export_root, scene_base, version_str, tag="cam"
-                )
-                FolderManager.ensure_directories({"abc": paths["abc"]})
-                all_paths["abc"] = paths["abc"]
-                results["abc"] = exporter.export_abc(
-                    paths["abc"], camera, geo_roots, [],
-                    start_frame, end_frame
-                )
-                self._log_result("ABC", results["abc"])
-                self._advance_progress()
+        # T-pose handling: FBX and ABC include T-pose frame in their
+        # range.  The .ma export and QC playblast keep the original
+        # timeline range (T-pose exists outside the range in .ma).
+        if cmds.checkBox(self.tpose_checkbox, query=True, value=True):
+            tpose_frame = cmds.intField(
+                self.tpose_frame_field, query=True, value=True
+            )
+            kwargs["tpose_start"] = min(kwargs["start_frame"], tpose_frame)
 
-            if do_mov:
-                paths = FolderManager.build_export_paths(
-                    export_root, scene_base, version_str, tag="cam"
-                )
-                fmt_choice = cmds.optionMenu(
-                    self.ct_mov_format_menu, query=True, value=True)
-                png_mode = "PNG" in fmt_choice
-                mp4_mode = ".mp4" in fmt_choice
-                if mp4_mode:
-                    pb_path = paths["mp4_tmp_file"]
-                    if not os.path.exists(paths["mp4_tmp_dir"]):
-                        os.makedirs(paths["mp4_tmp_dir"])
-                    all_paths["mov"] = paths["mp4"]
-                elif png_mode:
-                    pb_path = paths["png_file"]
-                    if not os.path.exists(paths["png_dir"]):
-                        os.makedirs(paths["png_dir"])
-                    all_paths["mov"] = paths["png_dir"]
-                else:
-                    pb_path = paths["mov"]
-                    FolderManager.ensure_directories(
-                        {"mov": paths["mov"]})
-                    all_paths["mov"] = paths["mov"]
-                raw_pb = cmds.checkBox(
-                    self.ct_raw_playblast_cb, query=True, value=True)
-                raw_srgb = cmds.checkBox(
-                    self.ct_raw_srgb_cb, query=True, value=True)
-                wf_shader = cmds.checkBox(
-                    self.ct_wireframe_shader_cb, query=True, value=True)
-                aa16 = cmds.checkBox(
-                    self.ct_aa16_cb, query=True, value=True)
-                results["mov"] = exporter.export_playblast(
-                    pb_path, camera, start_frame, end_frame,
-                    camera_track_mode=True,
-                    raw_playblast=raw_pb,
-                    render_raw_srgb=raw_srgb,
-                    wireframe_shader=wf_shader,
-                    wireframe_shader_geo=geo_roots,
-                    msaa_16=aa16,
-                    png_mode=png_mode,
-                    mp4_mode=mp4_mode,
-                    mp4_output=paths.get("mp4"),
-                )
-                self._log_result("QC Playblast", results["mov"])
-                self._advance_progress()
-        finally:
-            # Restore original camera name
-            if renamed_cam and cmds.objExists(renamed_cam):
-                cmds.rename(renamed_cam, original_cam_name)
+        if kwargs["do_mov"]:
+            kwargs.update(self._gather_playblast_settings("mm"))
+        return ExportSettings(**kwargs)
 
-        self._finish_export(results, all_paths, original_sel)
+    def _gather_face_track_settings(self):
+        """Snapshot the Face Track tab into an ExportSettings.
 
-    def _export_matchmove(self):
-        """Export pipeline for Matchmove tab (identical to v1.0 behavior)."""
-        errors, warnings = self._validate_matchmove()
+        The face meshes are stored in geo_roots.
+        """
+        kwargs = self._gather_shared_settings()
+        kwargs.update(
+            camera=cmds.textFieldButtonGrp(
+                self.ft_camera_field, query=True, text=True).strip(),
+            static_geo=cmds.textFieldButtonGrp(
+                self.ft_static_geo_field, query=True, text=True).strip(),
+            geo_roots=self._query_fields(
+                self.ft_face_mesh_entries.handles["field"]),
+            do_ma=cmds.checkBox(self.ft_ma_checkbox, query=True, value=True),
+            do_fbx=cmds.checkBox(self.ft_fbx_checkbox, query=True, value=True),
+            do_mov=cmds.checkBox(self.ft_mov_checkbox, query=True, value=True),
+        )
+        if kwargs["do_mov"]:
+            kwargs.update(self._gather_playblast_settings("ft"))
+        return ExportSettings(**kwargs)
+
+    # --- Export pipelines ---
+
+    def _confirm_validation(self, errors, warnings):
+        """Report validation results; return True if the export may run."""
         if errors:
-            for e in errors:
-                self._log(e)
-            cmds.confirmDialog(
-                title="Export Errors",
-                message="Export Genie {}\n\n{}".format(
-                    TOOL_VERSION, "\n\n".join(errors)),
-                button=["OK"],
-            )
-            return
+            self._log_batch(errors)
+            if self._interactive:
+                cmds.confirmDialog(
+                    title="Export Errors",
+                    message=_EXPORT_HEADER + "\n\n".join(errors),
+                    button=["OK"],
+                )
+            return False
 
-        if warnings:
+        if warnings and not self._interactive:
+            self._log_batch(warnings)
+        elif warnings:
             result = cmds.confirmDialog(
                 title="Warnings",
-                message="Export Genie {}\n\n{}".format(
-                    TOOL_VERSION, "\n\n".join(warnings)),
+                message=_EXPORT_HEADER + "\n\n".join(warnings),
                 button=["Continue", "Cancel"],
                 defaultButton="Continue",
                 cancelButton="Cancel",
@@ -5240,304 +5277,91 @@ class MultiExportUI(object):
             )
             if result == "Cancel":
                 self._log("Export cancelled by user.")
-                return
-
-        original_sel = cmds.ls(selection=True)
+                return False
+        return True
 
-        # Gather settings
-        export_root = cmds.textFieldButtonGrp(
-            self.export_root_field, query=True, text=True
-        ).strip()
-        camera = cmds.textFieldButtonGrp(
-            self.mm_camera_field, query=True, text=True
-        ).strip()
-        proxy_geos = []
-        for entry in self.mm_static_geo_fields:
-            pg = cmds.textFieldButtonGrp(
-                entry["field"], query=True, text=True
-            ).strip()
-            if pg:
-                proxy_geos.append(pg)
-        rig_roots = []
-        geo_roots = []
-        for pair in self.mm_rig_geo_pairs:
-            r = cmds.textFieldButtonGrp(
-                pair["rig_field"], query=True, text=True
-            ).strip()
-            g = cmds.textFieldButtonGrp(
-                pair["geo_field"], query=True, text=True
-            ).strip()
-            if r:
-                rig_roots.append(r)
-            if g:
-                geo_roots.append(g)
-        do_ma = cmds.checkBox(self.mm_ma_checkbox, query=True, value=True)
-        do_fbx = cmds.checkBox(self.mm_fbx_checkbox, query=True, value=True)
-        do_abc = cmds.checkBox(self.mm_abc_checkbox, query=True, value=True)
-        do_mov = cmds.checkBox(self.mm_mov_checkbox, query=True, value=True)
-        start_frame = cmds.intField(
-            self.start_frame_field, query=True, value=True
-        )
-        end_frame = cmds.intField(
-            self.end_frame_field, query=True, value=True
-        )
+    def _run_export_pipeline(self, validate, gather, prepare_paths, specs):
+        """Shared orchestration for every tab's export.
 
-        # T-pose handling: FBX and ABC include T-pose frame in their
-        # range.  The .ma export and QC playblast keep the original
-        # timeline range (T-pose exists outside the range in .ma).
-        tpose_start = start_frame
-        if cmds.checkBox(self.tpose_checkbox, query=True, value=True):
-            tpose_frame = cmds.intField(
-                self.tpose_frame_field, query=True, value=True
-            )
-            tpose_start = min(start_frame, tpose_frame)
+        Args:
+            validate: Callable returning ``(errors, warnings)``.
+            gather: Callable returning the tab's ExportSettings.
+            prepare_paths: Callable taking the settings and returning the
+                paths dict handed to each format builder.
+            specs: ExportFormatSpec entries, run in order when their
+                ``enabled_attr`` is set on the settings.  A builder may
+                return a callable instead of a flag to finish later.
+        """
+        errors, warnings = validate()
+        if not self._confirm_validation(errors, warnings):
+            return
 
-        # Read version from UI field
-        scene_short = cmds.file(
-            query=True, sceneName=True, shortName=True
-        )
-        version_str = cmds.textFieldGrp(
-            self.version_field, query=True, text=True).strip()
-        if not version_str:
-            version_str = "v01"
-        scene_base = VersionParser.get_scene_base_name(scene_short)
+        original_sel = cmds.ls(selection=True)
+        settings = gather()
 
         # Resolve versioned directories (rename older version folders)
         FolderManager.resolve_versioned_dir(
-            export_root, scene_base, version_str
+            settings.export_root, settings.scene_base, settings.version_str
         )
+        paths = prepare_paths(settings)
 
-        # Build paths and create directories (exclude PNG and MP4 temp
-        # dirs — those are created on demand only when that format is selected)
-        paths = FolderManager.build_export_paths(
-            export_root, scene_base, version_str, tag="charMM"
-        )
-        FolderManager.ensure_directories(
-            {k: v for k, v in paths.items()
-             if k not in ("png_dir", "png_file",
-                          "mp4_tmp_dir", "mp4_tmp_file")})
-
-        dir_path = os.path.dirname(paths.get("ma", paths.get("fbx", "")))
-        self._log("Export to: {}".format(dir_path))
-
-        exporter = Exporter(self._log)
+        exporter = self._exporter
         results = {}
 
-        # Progress bar
-        total_formats = sum([do_ma, do_fbx, do_abc, do_mov])
-        self._reset_progress(total_formats)
+        active = [s for s in specs if getattr(settings, s.enabled_attr)]
+        self._reset_progress(sum(s.progress_steps for s in active))
 
         # Rename camera to cam_main for all exports
         renamed_cam = None
-        original_cam_name = camera
+        original_cam_name = settings.camera
         try:
-            if camera:
-                if camera == "cam_main" and cmds.objExists(camera):
-                    # Already named correctly — no rename needed
-                    pass
-                elif cmds.objExists(camera):
-                    renamed_cam = cmds.rename(camera, "cam_main")
-                    camera = renamed_cam
-                elif cmds.objExists("cam_main"):
-                    renamed_cam = "cam_main"
-                    camera = "cam_main"
-                else:
-                    self._log(
-                        "[WARN] Camera '{}' not found.".format(camera))
-                    camera = None
-
-            if do_ma:
-                results["ma"] = exporter.export_ma(
-                    paths["ma"], camera, geo_roots, rig_roots, proxy_geos,
-                    start_frame=start_frame, end_frame=end_frame,
-                )
-                self._log_result("MA", results["ma"])
-                self._advance_progress()
-
-            if do_fbx:
-                self._log("[Matchmove] Preparing scene for UE5 FBX...")
-                cmds.undoInfo(openChunk=True)
-                try:
-                    exporter.prep_for_ue5_fbx_export(
-                        geo_roots, rig_roots, tpose_start, end_frame,
-                        camera=camera)
-                    # Namespace stripping in prep may have renamed nodes.
-                    # Resolve to long (unique) names so select succeeds.
-                    def _resolve_name(name):
-                        """Return a unique DAG path after namespace strip."""
-                        if not name:
-                            return name
-                        long_names = cmds.ls(name, long=True)
-                        if long_names:
-                            return long_names[0]
-                        # Name gone — try without namespace prefix
-                        short = name.rsplit(":", 1)[-1]
-                        long_names = cmds.ls(short, long=True)
-                        if len(long_names) == 1:
-                            return long_names[0]
-                        # Multiple matches — find by matching tail of
-                        # the original long path structure
-                        if long_names:
-                            return long_names[0]
-                        return name
-                    fbx_geo = [_resolve_name(g) for g in geo_roots]
-                    fbx_rigs = [_resolve_name(r) for r in rig_roots]
-                    fbx_proxies = [_resolve_name(p) for p in proxy_geos]
-                    fbx_cam = _resolve_name(camera) if camera else camera
-                    results["fbx"] = exporter.export_fbx(
-                        paths["fbx"], fbx_cam, fbx_geo, fbx_rigs,
-                        fbx_proxies, tpose_start, end_frame
-                    )
-                except Exception as exc:
-                    self._log(
-                        "[Matchmove] FBX prep/export failed: "
-                        "{}".format(exc))
-                    results["fbx"] = False
-                finally:
-                    cmds.undoInfo(closeChunk=True)
-                    try:
-                        cmds.undo()
-                        self._log("[Matchmove] Scene restored via undo.")
-                    except Exception:
-                        self._log(
-                            "[Matchmove] WARNING: Undo failed — scene "
-                            "may contain prep artifacts.")
-                self._log_result("FBX", results.get("fbx", False))
-                self._advance_progress()
-
-            if do_abc:
-                results["abc"] = exporter.export_abc(
-                    paths["abc"], camera, geo_roots, proxy_geos,
-                    tpose_start, end_frame
-                )
-                self._log_result("ABC", results["abc"])
-                self._advance_progress()
-
-            if do_mov:
-                fmt_choice = cmds.optionMenu(
-                    self.mm_mov_format_menu, query=True, value=True)
-                png_mode = "PNG" in fmt_choice
-                mp4_mode = ".mp4" in fmt_choice
-                if mp4_mode:
-                    pb_path = paths["mp4_tmp_file"]
-                    if not os.path.exists(paths["mp4_tmp_dir"]):
-                        os.makedirs(paths["mp4_tmp_dir"])
-                elif png_mode:
-                    pb_path = paths["png_file"]
-                    if not os.path.exists(paths["png_dir"]):
-                        os.makedirs(paths["png_dir"])
-                else:
-                    pb_path = paths["mov"]
-                raw_pb = cmds.checkBox(
-                    self.mm_raw_playblast_cb, query=True, value=True)
-                raw_srgb = cmds.checkBox(
-                    self.mm_raw_srgb_cb, query=True, value=True)
-                chk_scale = cmds.intSliderGrp(
-                    self.mm_checker_scale, query=True, value=True)
-                chk_color = tuple(cmds.colorSliderGrp(
-                    self.mm_checker_color, query=True, rgbValue=True))
-                chk_opacity = cmds.intSliderGrp(
-                    self.mm_checker_opacity, query=True, value=True)
-                aa16 = cmds.checkBox(
-                    self.mm_aa16_cb, query=True, value=True)
-                results["mov"] = exporter.export_playblast(
-                    pb_path, camera, start_frame, end_frame,
-                    matchmove_geo=geo_roots,
-                    checker_scale=chk_scale,
-                    checker_color=chk_color,
-                    checker_opacity=chk_opacity,
-                    raw_playblast=raw_pb,
-                    render_raw_srgb=raw_srgb,
-                    msaa_16=aa16,
-                    png_mode=png_mode,
-                    mp4_mode=mp4_mode,
-                    mp4_output=paths.get("mp4"),
-                )
-                self._log_result("QC Playblast", results["mov"])
+            camera, renamed_cam = self._resolve_camera_for_export(
+                settings.camera)
+            settings = settings._replace(camera=camera)
+            pending = []
+            try:
+                for spec in active:
+                    result = spec.builder(exporter, settings, paths)
+                    if callable(result):
+                        # Still running in the background (the .mp4
+                        # encode); collected after the remaining formats.
+                        pending.append((spec, result))
+                        continue
+                    results[spec.name] = result
+                    self._log_result(spec.label, result)
+                    self._advance_progress()
+            except Exception:
+                # A later format raised: stop any background encode and
+                # drop its temp frames, reporting it as failed.
+                for spec, finish in pending:
+                    results[spec.name] = finish(abort=True)
+                    self._log_result(spec.label, results[spec.name])
+                raise
+            for spec, finish in pending:
+                results[spec.name] = finish()
+                self._log_result(spec.label, results[spec.name])
                 self._advance_progress()
         finally:
-            # Restore original camera name
-            if renamed_cam and cmds.objExists(renamed_cam):
-                cmds.rename(renamed_cam, original_cam_name)
+            # Restore original camera name.  Trust the rename and only
+            # check existence if it fails (camera removed mid-export).
+            if renamed_cam:
+                try:
+                    _rename_without_undo(renamed_cam, original_cam_name)
+                except RuntimeError:
+                    if _obj_exists(renamed_cam):
+                        raise
 
         self._finish_export(results, paths, original_sel)
 
-    def _export_face_track(self):
-        """Export pipeline for Face Track tab."""
-        errors, warnings = self._validate_face_track()
-        if errors:
-            for e in errors:
-                self._log(e)
-            cmds.confirmDialog(
-                title="Export Errors",
-                message="Export Genie {}\n\n{}".format(
-                    TOOL_VERSION, "\n\n".join(errors)),
-                button=["OK"],
-            )
-            return
+    def _prepare_tagged_paths(self, settings, tag):
+        """Build and create the per-format paths for a tagged export.
 
-        if warnings:
-            result = cmds.confirmDialog(
-                title="Warnings",
-                message="Export Genie {}\n\n{}".format(
-                    TOOL_VERSION, "\n\n".join(warnings)),
-                button=["Continue", "Cancel"],
-                defaultButton="Continue",
-                cancelButton="Cancel",
-                dismissString="Cancel",
-            )
-            if result == "Cancel":
-                self._log("Export cancelled by user.")
-                return
-
-        original_sel = cmds.ls(selection=True)
-
-        # Gather settings
-        export_root = cmds.textFieldButtonGrp(
-            self.export_root_field, query=True, text=True
-        ).strip()
-        camera = cmds.textFieldButtonGrp(
-            self.ft_camera_field, query=True, text=True
-        ).strip()
-        static_geo = cmds.textFieldButtonGrp(
-            self.ft_static_geo_field, query=True, text=True
-        ).strip()
-        face_meshes = []
-        for entry in self.ft_face_mesh_entries:
-            fm = cmds.textFieldButtonGrp(
-                entry["field"], query=True, text=True
-            ).strip()
-            if fm:
-                face_meshes.append(fm)
-        do_ma = cmds.checkBox(self.ft_ma_checkbox, query=True, value=True)
-        do_fbx = cmds.checkBox(self.ft_fbx_checkbox, query=True, value=True)
-        do_mov = cmds.checkBox(self.ft_mov_checkbox, query=True, value=True)
-        start_frame = cmds.intField(
-            self.start_frame_field, query=True, value=True
-        )
-        end_frame = cmds.intField(
-            self.end_frame_field, query=True, value=True
-        )
-
-        # Read version from UI field
-        scene_short = cmds.file(
-            query=True, sceneName=True, shortName=True
-        )
-        version_str = cmds.textFieldGrp(
-            self.version_field, query=True, text=True).strip()
-        if not version_str:
-            version_str = "v01"
-        scene_base = VersionParser.get_scene_base_name(scene_short)
-
-        # Resolve versioned directories
-        FolderManager.resolve_versioned_dir(
-            export_root, scene_base, version_str
-        )
-
-        # Build paths and create directories (exclude PNG and MP4 temp
-        # dirs — those are created on demand only when that format is selected)
+        PNG and MP4 temp dirs are excluded — those are created on demand
+        only when that format is selected.
+        """
         paths = FolderManager.build_export_paths(
-            export_root, scene_base, version_str, tag="KTHead"
+            settings.export_root, settings.scene_base, settings.version_str,
+            tag=tag
         )
         FolderManager.ensure_directories(
             {k: v for k, v in paths.items()
@@ -5546,178 +5370,374 @@ class MultiExportUI(object):
 
         dir_path = os.path.dirname(paths.get("ma", paths.get("fbx", "")))
         self._log("Export to: {}".format(dir_path))
+        return paths
 
-        exporter = Exporter(self._log)
-        results = {}
+    @staticmethod
+    def _playblast_target(settings, paths):
+        """Return ``(pb_path, png_mode, mp4_mode)`` for the QC format."""
+        png_mode = settings.qc_mode == "png"
+        mp4_mode = settings.qc_mode == "mp4"
+        if mp4_mode:
+            os.makedirs(paths["mp4_tmp_dir"], exist_ok=True)
+            return paths["mp4_tmp_file"], png_mode, mp4_mode
+        if png_mode:
+            os.makedirs(paths["png_dir"], exist_ok=True)
+            return paths["png_file"], png_mode, mp4_mode
+        return paths["mov"], png_mode, mp4_mode
+
+    def _export_checker_playblast(self, exporter, settings, paths):
+        """QC playblast with the checker overlay (Matchmove/Face Track)."""
+        pb_path, png_mode, mp4_mode = self._playblast_target(settings, paths)
+        return exporter.export_playblast(
+            pb_path, settings.camera, settings.start_frame,
+            settings.end_frame,
+            matchmove_geo=settings.geo_roots,
+            checker_scale=settings.chk_scale,
+            checker_color=settings.chk_color,
+            checker_opacity=settings.chk_opacity,
+            raw_playblast=settings.raw_pb,
+            render_raw_srgb=settings.raw_srgb,
+            msaa_16=settings.aa16,
+            png_mode=png_mode,
+            mp4_mode=mp4_mode,
+            mp4_output=paths.get("mp4"),
+            defer_encode=True,
+        )
+
+    # --- Camera Track ---
 
-        # Progress bar
-        total_formats = sum([do_ma, do_fbx, do_mov])
-        self._reset_progress(total_formats)
+    def _export_camera_track(self):
+        """Export pipeline for Camera Track tab."""
+        self._run_export_pipeline(
+            self._validate_camera_track,
+            self._gather_camera_track_settings,
+            self._prepare_camera_track_paths,
+            [
+                # JSX counts as 2 steps (setup + timeline scrub)
+                ExportFormatSpec("jsx", "do_jsx", "JSX + OBJ",
+                                 self._ct_export_jsx, 2),
+                ExportFormatSpec("ma", "do_ma", "MA", self._ct_export_ma),
+                ExportFormatSpec("fbx", "do_fbx", "FBX", self._ct_export_fbx),
+                ExportFormatSpec("abc", "do_abc", "ABC", self._ct_export_abc),
+                ExportFormatSpec("mov", "do_mov", "QC Playblast",
+                                 self._ct_export_mov),
+            ],
+        )
+
+    def _prepare_camera_track_paths(self, settings):
+        """Resolve the AE dir and build the shared "cam" paths once.
+
+        Unlike the tagged tabs, each format creates only its own folder.
+        """
+        main_dir = os.path.join(
+            settings.export_root,
+            "{}_track_{}".format(settings.scene_base, settings.version_str),
+        )
+        FolderManager.resolve_ae_dir(
+            main_dir, settings.scene_base, settings.version_str)
 
-        # Rename camera to cam_main for all exports
-        renamed_cam = None
-        original_cam_name = camera
+        self._log("Export to: {}".format(main_dir))
+        return FolderManager.build_export_paths(
+            settings.export_root, settings.scene_base, settings.version_str,
+            tag="cam"
+        )
+
+    def _ct_export_jsx(self, exporter, settings, paths):
+        """JSX + OBJ export for After Effects."""
+        camera, geo_roots = settings.camera, settings.geo_roots
+        geo_pairs = chain.from_iterable(
+            Exporter._direct_transform_children(gr, include_root=True)
+            for gr in geo_roots)
+        # Exclude camera, chisels, and nulls from OBJ paths
+        # (nulls/locators are handled separately inside export_jsx)
+        cam_ancestors = Exporter._camera_ancestors(camera)
+        geo_children = [
+            c for c, c_fp in geo_pairs
+            if c_fp not in cam_ancestors
+            and not _GEO_SKIP_RE.search(c)
+        ]
+
+        ae_paths = FolderManager.build_ae_export_paths(
+            settings.export_root, settings.scene_base, settings.version_str,
+            geo_children
+        )
+        FolderManager.ensure_ae_directories(ae_paths)
+        paths["jsx"] = ae_paths["jsx"]
+        self._advance_progress()  # step 1: setup complete
+
+        # JSX export uses the first geo root as the primary group
+        jsx_geo_root = geo_roots[0] if geo_roots else None
+        return exporter.export_jsx(
+            ae_paths["jsx"], ae_paths["obj"], camera, jsx_geo_root,
+            settings.start_frame, settings.end_frame
+        )
+
+    def _ct_export_ma(self, exporter, settings, paths):
+        """Camera Track .ma export."""
+        FolderManager.ensure_directories({"ma": paths["ma"]})
+        return exporter.export_ma(
+            paths["ma"], settings.camera, settings.geo_roots, [], [],
+            start_frame=settings.start_frame, end_frame=settings.end_frame,
+        )
+
+    def _ct_export_fbx(self, exporter, settings, paths):
+        """Camera Track .fbx export."""
+        FolderManager.ensure_directories({"fbx": paths["fbx"]})
+        return exporter.export_fbx(
+            paths["fbx"], settings.camera, settings.geo_roots, [], [],
+            settings.start_frame, settings.end_frame
+        )
+
+    def _ct_export_abc(self, exporter, settings, paths):
+        """Camera Track .abc export."""
+        FolderManager.ensure_directories({"abc": paths["abc"]})
+        return exporter.export_abc(
+            paths["abc"], settings.camera, settings.geo_roots, [],
+            settings.start_frame, settings.end_frame
+        )
+
+    def _ct_export_mov(self, exporter, settings, paths):
+        """Camera Track QC playblast."""
+        pb_path, png_mode, mp4_mode = self._playblast_target(settings, paths)
+        if not (mp4_mode or png_mode):
+            FolderManager.ensure_directories({"mov": paths["mov"]})
+        return exporter.export_playblast(
+            pb_path, settings.camera, settings.start_frame,
+            settings.end_frame,
+            camera_track_mode=True,
+            raw_playblast=settings.raw_pb,
+            render_raw_srgb=settings.raw_srgb,
+            wireframe_shader=settings.wf_shader,
+            wireframe_shader_geo=settings.geo_roots,
+            msaa_16=settings.aa16,
+            png_mode=png_mode,
+            mp4_mode=mp4_mode,
+            mp4_output=paths.get("mp4"),
+            defer_encode=True,
+        )
+
+    # --- Matchmove ---
+
+    def _export_matchmove(self):
+        """Export pipeline for Matchmove tab (identical to v1.0 behavior)."""
+        self._run_export_pipeline(
+            self._validate_matchmove,
+            self._gather_matchmove_settings,
+            partial(self._prepare_tagged_paths, tag="charMM"),
+            [
+                ExportFormatSpec("ma", "do_ma", "MA", self._mm_export_ma),
+                ExportFormatSpec("fbx", "do_fbx", "FBX", self._mm_export_fbx),
+                ExportFormatSpec("abc", "do_abc", "ABC", self._mm_export_abc),
+                ExportFormatSpec("mov", "do_mov", "QC Playblast",
+                                 self._export_checker_playblast),
+            ],
+        )
+
+    def _mm_export_ma(self, exporter, settings, paths):
+        """Matchmove .ma export (original timeline range)."""
+        return exporter.export_ma(
+            paths["ma"], settings.camera, settings.geo_roots,
+            settings.rig_roots, settings.proxy_geos,
+            start_frame=settings.start_frame, end_frame=settings.end_frame,
+        )
+
+    def _mm_export_fbx(self, exporter, settings, paths):
+        """Matchmove UE5 FBX export; prep is undone afterwards."""
+        camera = settings.camera
+        geo_roots, rig_roots = settings.geo_roots, settings.rig_roots
+        proxy_geos = settings.proxy_geos
+        result = False
+        self._log("[Matchmove] Preparing scene for UE5 FBX...")
+        cmds.undoInfo(openChunk=True, chunkName="mm_fbx_prep")
         try:
-            if camera:
-                if camera == "cam_main" and cmds.objExists(camera):
-                    # Already named correctly — no rename needed
-                    pass
-                elif cmds.objExists(camera):
-                    renamed_cam = cmds.rename(camera, "cam_main")
-                    camera = renamed_cam
-                elif cmds.objExists("cam_main"):
-                    renamed_cam = "cam_main"
-                    camera = "cam_main"
-                else:
-                    self._log(
-                        "[WARN] Camera '{}' not found.".format(camera))
-                    camera = None
-
-            if do_ma:
-                # MA export: no conversion, Alembic animation stays intact
-                static_geos = [static_geo] if static_geo else []
-                results["ma"] = exporter.export_ma(
-                    paths["ma"], camera, face_meshes, [], static_geos,
-                    start_frame=start_frame, end_frame=end_frame,
+            exporter.prep_for_ue5_fbx_export(
+                geo_roots, rig_roots, settings.tpose_start,
+                settings.end_frame, camera=camera)
+            # Namespace stripping in prep may have renamed nodes.
+            # Resolve to long (unique) names so select succeeds.
+            resolved = self._resolve_long_names(
+                geo_roots + rig_roots + proxy_geos + [camera])
+            fbx_geo = [resolved[g] for g in geo_roots]
+            fbx_rigs = [resolved[r] for r in rig_roots]
+            fbx_proxies = [resolved[p] for p in proxy_geos]
+            fbx_cam = resolved[camera] if camera else camera
+            result = exporter.export_fbx(
+                paths["fbx"], fbx_cam, fbx_geo, fbx_rigs,
+                fbx_proxies, settings.tpose_start, settings.end_frame
+            )
+        except Exception as exc:
+            self._log(
+                "[Matchmove] FBX prep/export failed: "
+                "{}".format(exc))
+            result = False
+        finally:
+            cmds.undoInfo(closeChunk=True)
+            try:
+                cmds.undo()
+                self._log("[Matchmove] Scene restored via undo.")
+            except Exception:
+                self._log(
+                    "[Matchmove] WARNING: Undo failed — scene "
+                    "may contain prep artifacts.")
+        return result
+
+    def _mm_export_abc(self, exporter, settings, paths):
+        """Matchmove .abc export (T-pose inclusive range)."""
+        return exporter.export_abc(
+            paths["abc"], settings.camera, settings.geo_roots,
+            settings.proxy_geos, settings.tpose_start, settings.end_frame
+        )
+
+    # --- Face Track ---
+
+    def _export_face_track(self):
+        """Export pipeline for Face Track tab."""
+        self._run_export_pipeline(
+            self._validate_face_track,
+            self._gather_face_track_settings,
+            partial(self._prepare_tagged_paths, tag="KTHead"),
+            [
+                ExportFormatSpec("ma", "do_ma", "MA", self._ft_export_ma),
+                ExportFormatSpec("fbx", "do_fbx", "FBX", self._ft_export_fbx),
+                ExportFormatSpec("mov", "do_mov", "QC Playblast",
+                                 self._export_checker_playblast),
+            ],
+        )
+
+    def _ft_export_ma(self, exporter, settings, paths):
+        """Face Track .ma export."""
+        # MA export: no conversion, Alembic animation stays intact
+        static_geos = [settings.static_geo] if settings.static_geo else []
+        return exporter.export_ma(
+            paths["ma"], settings.camera, settings.geo_roots, [], static_geos,
+            start_frame=settings.start_frame, end_frame=settings.end_frame,
+        )
+
+    def _ft_export_fbx(self, exporter, settings, paths):
+        """Face Track FBX export; conversion is undone afterwards."""
+        # FBX export: traverse groups, classify descendants,
+        # convert/bake as needed, then undo to restore scene
+        result = False
+        self._log("[FaceTrack] Classifying and preparing geometry...")
+        # The bake and export are long; skip viewport redraws meanwhile.
+        self._flush_log()
+        cmds.waitCursor(state=True)
+        cmds.refresh(suspend=True)
+        # Outer try: the redraw and cursor come back even if the undo or
+        # cleanup below raises.
+        try:
+            # One named chunk spans the whole prep, so a single undo()
+            # reverts every conversion at once.
+            cmds.undoInfo(openChunk=True, chunkName="ft_prep")
+            prep = {
+                "base_meshes": [],
+                "select_for_export": [],
+            }
+            try:
+                prep = exporter.prepare_face_track_for_export(
+                    settings.geo_roots, settings.start_frame,
+                    settings.end_frame,
                 )
-                self._log_result("MA", results["ma"])
-                self._advance_progress()
 
-            if do_fbx:
-                # FBX export: traverse groups, classify descendants,
-                # convert/bake as needed, then undo to restore scene
-                self._log("[FaceTrack] Classifying and preparing geometry...")
-                cmds.undoInfo(openChunk=True)
-                prep = {
-                    "base_meshes": [],
-                    "select_for_export": [],
-                }
-                try:
-                    prep = exporter.prepare_face_track_for_export(
-                        face_meshes, start_frame, end_frame
+                if not prep["select_for_export"]:
+                    self._log("[FaceTrack] No geometry found to export.")
+                    result = False
+                else:
+                    self._log(
+                        "[FaceTrack] Exporting {} object(s) to "
+                        "FBX...".format(
+                            len(prep["select_for_export"])))
+                    for obj in prep["select_for_export"]:
+                        self._log("[FaceTrack]   - {}".format(obj))
+                    static_geos = (
+                        [settings.static_geo] if settings.static_geo else [])
+                    result = exporter.export_fbx(
+                        paths["fbx"], settings.camera,
+                        prep["select_for_export"], [],
+                        static_geos, settings.start_frame, settings.end_frame,
+                        export_input_connections=True,
                     )
-
-                    if not prep["select_for_export"]:
-                        self._log("[FaceTrack] No geometry found to export.")
-                        results["fbx"] = False
-                    else:
-                        self._log(
-                            "[FaceTrack] Exporting {} object(s) to "
-                            "FBX...".format(
-                                len(prep["select_for_export"])))
-                        for obj in prep["select_for_export"]:
-                            self._log("[FaceTrack]   - {}".format(obj))
-                        static_geos = [static_geo] if static_geo else []
-                        results["fbx"] = exporter.export_fbx(
-                            paths["fbx"], camera,
-                            prep["select_for_export"], [],
-                            static_geos, start_frame, end_frame,
-                            export_input_connections=True,
-                        )
-                except Exception as exc:
+            except Exception as exc:
+                self._log(
+                    "[FaceTrack] FBX conversion/export failed: "
+                    "{}".format(exc))
+                result = False
+            finally:
+                cmds.undoInfo(closeChunk=True)
+                try:
+                    cmds.undo()
+                    self._log("[FaceTrack] Scene restored via undo.")
+                except Exception:
                     self._log(
-                        "[FaceTrack] FBX conversion/export failed: "
-                        "{}".format(exc))
-                    results["fbx"] = False
-                finally:
-                    cmds.undoInfo(closeChunk=True)
-                    try:
-                        cmds.undo()
-                        self._log("[FaceTrack] Scene restored via undo.")
-                    except Exception:
-                        self._log(
-                            "[FaceTrack] WARNING: Undo failed -- "
-                            "scene may contain conversion artifacts.")
-
-                    # Safety net: delete any surviving artifacts
-                    artifacts = [
-                        a for a in prep.get("base_meshes", [])
-                        if cmds.objExists(a)
-                    ]
-                    if artifacts:
-                        self._log(
-                            "[FaceTrack] Cleaning up {} remaining "
-                            "artifact(s)...".format(len(artifacts)))
-                        for artifact in artifacts:
-                            try:
-                                cmds.delete(artifact)
-                            except Exception:
-                                pass
+                        "[FaceTrack] WARNING: Undo failed -- "
+                        "scene may contain conversion artifacts.")
+                # Safety net: delete any surviving artifacts.  undo() is a
+                # silent no-op when the undo queue is off, so always check.
+                self._delete_ft_artifacts(prep.get("base_meshes", []))
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.waitCursor(state=False)
+        return result
 
-                self._log_result("FBX", results.get("fbx", False))
-                self._advance_progress()
+    def _delete_ft_artifacts(self, base_meshes):
+        """Delete Face Track conversion meshes that survived the undo.
 
-            if do_mov:
-                fmt_choice = cmds.optionMenu(
-                    self.ft_mov_format_menu, query=True, value=True)
-                png_mode = "PNG" in fmt_choice
-                mp4_mode = ".mp4" in fmt_choice
-                if mp4_mode:
-                    pb_path = paths["mp4_tmp_file"]
-                    if not os.path.exists(paths["mp4_tmp_dir"]):
-                        os.makedirs(paths["mp4_tmp_dir"])
-                elif png_mode:
-                    pb_path = paths["png_file"]
-                    if not os.path.exists(paths["png_dir"]):
-                        os.makedirs(paths["png_dir"])
-                else:
-                    pb_path = paths["mov"]
-                raw_pb = cmds.checkBox(
-                    self.ft_raw_playblast_cb, query=True, value=True)
-                raw_srgb = cmds.checkBox(
-                    self.ft_raw_srgb_cb, query=True, value=True)
-                chk_scale = cmds.intSliderGrp(
-                    self.ft_checker_scale, query=True, value=True)
-                chk_color = tuple(cmds.colorSliderGrp(
-                    self.ft_checker_color, query=True, rgbValue=True))
-                chk_opacity = cmds.intSliderGrp(
-                    self.ft_checker_opacity, query=True, value=True)
-                aa16 = cmds.checkBox(
-                    self.ft_aa16_cb, query=True, value=True)
-                results["mov"] = exporter.export_playblast(
-                    pb_path, camera, start_frame, end_frame,
-                    matchmove_geo=face_meshes,
-                    checker_scale=chk_scale,
-                    checker_color=chk_color,
-                    checker_opacity=chk_opacity,
-                    raw_playblast=raw_pb,
-                    render_raw_srgb=raw_srgb,
-                    msaa_16=aa16,
-                    png_mode=png_mode,
-                    mp4_mode=mp4_mode,
-                    mp4_output=paths.get("mp4"),
-                )
-                self._log_result("QC Playblast", results["mov"])
-                self._advance_progress()
+        Internal cleanup, so it is kept off the undo queue.
+        """
+        artifacts = (cmds.ls(base_meshes) or []) if base_meshes else []
+        if not artifacts:
+            return
+        self._log(
+            "[FaceTrack] Cleaning up {} remaining "
+            "artifact(s)...".format(len(artifacts)))
+        undo_on = cmds.undoInfo(query=True, stateWithoutFlush=True)
+        cmds.undoInfo(stateWithoutFlush=False)
+        try:
+            cmds.delete(artifacts)
+        except Exception:
+            # One bad node fails the whole batch; retry singly.
+            for artifact in artifacts:
+                try:
+                    cmds.delete(artifact)
+                except Exception:
+                    pass
         finally:
-            # Restore original camera name
-            if renamed_cam and cmds.objExists(renamed_cam):
-                cmds.rename(renamed_cam, original_cam_name)
+            cmds.undoInfo(stateWithoutFlush=undo_on)
 
-        self._finish_export(results, paths, original_sel)
+    # --- Completion ---
 
     def _finish_export(self, results, paths, original_sel):
         """Restore selection and show completion dialog."""
         self._hide_progress()
 
-        if original_sel:
-            cmds.select(original_sel, replace=True)
+        # Reselect what still exists, as-is: noExpand keeps sets from being
+        # re-expanded into their members (fine for this tool's picks).
+        surviving = (cmds.ls(original_sel) or []) if original_sel else []
+        if surviving:
+            cmds.select(surviving, replace=True, noExpand=True)
         else:
             cmds.select(clear=True)
 
+        self._last_results = dict(results)
         failed = [k for k, v in results.items() if not v]
         if failed:
             self._log("Export finished with errors.")
+            if not self._interactive:
+                self._log("Failed: {}".format(
+                    ", ".join([f.upper() for f in failed])))
+                return
             cmds.confirmDialog(
                 title="Export Complete (with errors)",
-                message="Export Genie {}\n\nSome exports failed: {}\nSee Script Editor for details.".format(
-                    TOOL_VERSION,
-                    ", ".join(f.upper() for f in failed)
-                ),
+                message=_EXPORT_HEADER + (
+                    "Some exports failed: {}\n"
+                    "See Script Editor for details.".format(
+                        ", ".join([f.upper() for f in failed]))),
                 button=["OK"],
             )
         else:
             self._log("Export complete.")
+            if not self._interactive:
+                return
             cmds.confirmDialog(
                 title="Export Complete",
                 message="All exports completed successfully!",
@@ -5735,33 +5755,77 @@ def launch():
     _ui_instance.show()
 
 
+def run_export(tab=None):
+    """Run an export without modal dialogs, for scripted/batch callers.
+
+    Uses the settings in the open Export Genie window, opening one first if
+    needed. Validation errors abort the export and warnings are accepted;
+    these, missing-plugin/ffmpeg alerts and the outcome are written to the
+    tool log instead of dialogs. The window stays interactive afterwards.
+
+    Args:
+        tab: TAB_CAMERA_TRACK, TAB_MATCHMOVE or TAB_FACE_TRACK. Defaults to
+            the active tab.
+
+    Returns:
+        dict: ``{format: success}`` for the formats that ran; empty if the
+        export was aborted before exporting anything.
+    """
+    global _ui_instance
+    if _ui_instance is None or not cmds.window(WINDOW_NAME, exists=True):
+        _ui_instance = MultiExportUI()
+        _ui_instance.show()
+    ui = _ui_instance
+    was_interactive = ui._interactive
+    ui._interactive = ui._exporter.interactive = False
+    ui._last_results = {}
+    try:
+        if tab is not None:
+            tabs = (TAB_CAMERA_TRACK, TAB_MATCHMOVE, TAB_FACE_TRACK)
+            cmds.tabLayout(ui.tab_layout, edit=True,
+                           selectTabIndex=tabs.index(tab) + 1)
+        ui._on_export()
+    finally:
+        ui._interactive = ui._exporter.interactive = was_interactive
+    return dict(ui._last_results)
+
+
 # ---------------------------------------------------------------------------
 # Installer
 # ---------------------------------------------------------------------------
+# The directory helpers are cached: userAppDir cannot change within a
+# session, so one internalVar call serves the whole install.
+@lru_cache(maxsize=1)
 def _get_maya_app_dir():
     """Return the user's Maya application directory."""
     return cmds.internalVar(userAppDir=True)
 
 
+@lru_cache(maxsize=1)
 def _get_scripts_dir():
     """Return the user's Maya scripts directory."""
     return os.path.join(_get_maya_app_dir(), "scripts")
 
 
+@lru_cache(maxsize=1)
 def _get_icons_dir():
     """Return the user's Maya icons directory (create if needed)."""
     icons_dir = os.path.join(_get_maya_app_dir(), "prefs", "icons")
-    if not os.path.exists(icons_dir):
-        os.makedirs(icons_dir)
+    os.makedirs(icons_dir, exist_ok=True)
     return icons_dir
 
 
 def _install_icon():
-    """Decode the embedded icon and write it to Maya's icons directory."""
+    """Write the embedded icon to Maya's icons directory if it changed."""
     icon_path = os.path.join(_get_icons_dir(), ICON_FILENAME)
-    icon_bytes = base64.b64decode(ICON_DATA)
+    try:
+        with open(icon_path, "rb") as f:
+            if hashlib.file_digest(f, "sha256").digest() == _ICON_SHA256:
+                return icon_path  # already installed and identical
+    except OSError:
+        pass  # not installed yet (or unreadable) -> rewrite it
     with open(icon_path, "wb") as f:
-        f.write(icon_bytes)
+        f.write(_ICON_BYTES)
     return icon_path
 
 
@@ -5776,18 +5840,26 @@ def _create_shelf_button():
         top_shelf, query=True, selectTab=True
     )
 
-    # Remove existing button to avoid duplicates
+    # Remove existing button to avoid duplicates.  childArray only lists
+    # live controls, so no per-child exists query is needed.  Its names
+    # are short and may repeat on other shelves, so query by path.
+    shelf_path = "{}|{}".format(top_shelf, current_shelf)
     existing = cmds.shelfLayout(
         current_shelf, query=True, childArray=True
     ) or []
+    dups = []
     for btn in existing:
+        btn_path = "{}|{}".format(shelf_path, btn)
         try:
-            if cmds.shelfButton(btn, query=True, exists=True):
-                label = cmds.shelfButton(btn, query=True, label=True)
-                if label == SHELF_BUTTON_LABEL:
-                    cmds.deleteUI(btn)
-        except Exception:
+            if (cmds.objectTypeUI(btn_path) == "shelfButton"
+                    and cmds.shelfButton(btn_path, query=True, label=True)
+                    == SHELF_BUTTON_LABEL):
+                dups.append(btn_path)
+        except RuntimeError:
+            # An odd child must not abort the install.
             pass
+    if dups:
+        cmds.deleteUI(dups)
 
     # Create the button
     cmds.shelfButton(
@@ -5805,16 +5877,69 @@ def _create_shelf_button():
     )
 
 
+def _copy_file_fast(src, dst):
+    """Copy *src* to *dst* (contents and mode), in-kernel where possible.
+
+    Tries ``os.copy_file_range`` (Linux; reflinks on CoW filesystems) and
+    falls back to ``shutil.copyfile``, which already uses the platform's
+    fast path elsewhere.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    copied = False
+    if copy_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = copy_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not sent:
+                        break
+                    remaining -= sent
+            copied = remaining == 0
+        except OSError:
+            copied = False
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copymode(src, dst)
+    return dst
+
+
+def _copy_if_changed(src, dst):
+    """copytree copy_function that skips files already up to date.
+
+    rsync's quick check: an existing *dst* with the same size and mtime
+    (within 1 s, for FAT/SMB timestamp granularity) is left alone.
+    Copies keep *src*'s mtime so the next install can skip them.
+    """
+    src_st = os.stat(src)
+    try:
+        dst_st = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        if (src_st.st_size == dst_st.st_size
+                and abs(src_st.st_mtime - dst_st.st_mtime) < 1):
+            return dst
+    _copy_file_fast(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
 def install():
     """Install the tool: copy to scripts dir and create shelf button."""
     source_file = os.path.abspath(__file__)
     scripts_dir = _get_scripts_dir()
     dest_file = os.path.join(scripts_dir, "maya_multi_export.py")
 
-    # Copy self to Maya's scripts directory (if not already there)
-    if os.path.normpath(source_file) != os.path.normpath(dest_file):
-        if not os.path.exists(scripts_dir):
-            os.makedirs(scripts_dir)
+    # Copy self to Maya's scripts directory (if not already there).
+    # samefile also sees through symlinks and case-insensitive paths; a
+    # missing dest raises OSError, which just means "not installed yet".
+    try:
+        same = os.path.samefile(source_file, dest_file)
+    except OSError:
+        same = False
+    if not same:
+        os.makedirs(scripts_dir, exist_ok=True)
         shutil.copy2(source_file, dest_file)
 
     # Copy bundled bin/ directory (contains ffmpeg.exe for Windows)
@@ -5822,21 +5947,25 @@ def install():
     source_bin = os.path.join(source_dir, "bin")
     dest_bin = os.path.join(scripts_dir, "bin")
     if os.path.isdir(source_bin):
-        shutil.copytree(source_bin, dest_bin, dirs_exist_ok=True)
+        shutil.copytree(source_bin, dest_bin, dirs_exist_ok=True,
+                        copy_function=_copy_if_changed)
 
     # Clear compiled .pyc cache to ensure a fresh import
     pycache_dir = os.path.join(scripts_dir, "__pycache__")
-    if os.path.isdir(pycache_dir):
-        for f in os.listdir(pycache_dir):
-            if f.startswith(TOOL_NAME) and f.endswith(".pyc"):
-                try:
-                    os.remove(os.path.join(pycache_dir, f))
-                except OSError:
-                    pass
-
-    # Remove stale module and re-import fresh from scripts dir
+    for pyc in glob.iglob(os.path.join(pycache_dir, TOOL_NAME + "*.pyc")):
+        # A stale .pyc is harmless (the import checks the source mtime), so
+        # a locked or read-only file is reported but does not abort.
+        try:
+            Path(pyc).unlink(missing_ok=True)
+        except OSError as e:
+            cmds.warning(
+                "Export Genie: could not remove {}: {}".format(pyc, e))
+
+    # Remove stale module and re-import fresh from scripts dir.  Drop the
+    # path finders' cached directory listings so the copied .py is seen.
+    importlib.invalidate_caches()
     sys.modules.pop(TOOL_NAME, None)
-    mod = __import__(TOOL_NAME)
+    mod = importlib.import_module(TOOL_NAME)
 
     # Create shelf button and show dialog using the freshly loaded module
     mod._create_shelf_button()